@@ -14,1030 +14,427 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import json
 import math
 import pickle
+import sys
 import unittest
 
 from histogrammar import *
 from histogrammar.histogram import Histogram
 
+if sys.version_info[0] > 2:
+    stringTypes = (str,)
+    numberTypes = (int, float)
+else:
+    stringTypes = (basestring,)
+    numberTypes = (int, long, float)
+
+EXPECTED_count = json.loads('[{"data": 1.0, "type": "Count"}, {"data": 2.0, "type": "Count"}, {"data": 3.0, "type": "Count"}, {"data": 4.0, "type": "Count"}, {"data": 5.0, "type": "Count"}, {"data": 6.0, "type": "Count"}, {"data": 7.0, "type": "Count"}, {"data": 8.0, "type": "Count"}, {"data": 9.0, "type": "Count"}, {"data": 10.0, "type": "Count"}]')
+EXPECTED_weightedCount = json.loads('[{"data": 3.4, "type": "Count"}, {"data": 5.6, "type": "Count"}, {"data": 5.6, "type": "Count"}, {"data": 5.6, "type": "Count"}, {"data": 12.899999999999999, "type": "Count"}, {"data": 12.899999999999999, "type": "Count"}, {"data": 14.499999999999998, "type": "Count"}, {"data": 14.499999999999998, "type": "Count"}, {"data": 14.499999999999998, "type": "Count"}, {"data": 14.499999999999998, "type": "Count"}]')
+EXPECTED_summ = json.loads('[{"data": {"entries": 1.0, "sum": 4.4}, "type": "Sum"}, {"data": {"entries": 2.0, "sum": 7.6}, "type": "Sum"}, {"data": {"entries": 3.0, "sum": 6.8}, "type": "Sum"}, {"data": {"entries": 4.0, "sum": 7.8}, "type": "Sum"}, {"data": {"entries": 5.0, "sum": 16.1}, "type": "Sum"}, {"data": {"entries": 6.0, "sum": 12.399999999999999}, "type": "Sum"}, {"data": {"entries": 7.0, "sum": 15.0}, "type": "Sum"}, {"data": {"entries": 8.0, "sum": 16.0}, "type": "Sum"}, {"data": {"entries": 9.0, "sum": 14.0}, "type": "Sum"}, {"data": {"entries": 10.0, "sum": 13.3}, "type": "Sum"}]')
+EXPECTED_sumWithName = json.loads('[{"data": {"entries": 1.0, "name": "something", "sum": 4.4}, "type": "Sum"}, {"data": {"entries": 2.0, "name": "something", "sum": 7.6}, "type": "Sum"}, {"data": {"entries": 3.0, "name": "something", "sum": 6.8}, "type": "Sum"}, {"data": {"entries": 4.0, "name": "something", "sum": 7.8}, "type": "Sum"}, {"data": {"entries": 5.0, "name": "something", "sum": 16.1}, "type": "Sum"}, {"data": {"entries": 6.0, "name": "something", "sum": 12.399999999999999}, "type": "Sum"}, {"data": {"entries": 7.0, "name": "something", "sum": 15.0}, "type": "Sum"}, {"data": {"entries": 8.0, "name": "something", "sum": 16.0}, "type": "Sum"}, {"data": {"entries": 9.0, "name": "something", "sum": 14.0}, "type": "Sum"}, {"data": {"entries": 10.0, "name": "something", "sum": 13.3}, "type": "Sum"}]')
+EXPECTED_sumString = json.loads('[{"data": {"entries": 1.0, "name": "x + 1", "sum": 4.4}, "type": "Sum"}, {"data": {"entries": 2.0, "name": "x + 1", "sum": 7.6}, "type": "Sum"}, {"data": {"entries": 3.0, "name": "x + 1", "sum": 6.8}, "type": "Sum"}, {"data": {"entries": 4.0, "name": "x + 1", "sum": 7.8}, "type": "Sum"}, {"data": {"entries": 5.0, "name": "x + 1", "sum": 16.1}, "type": "Sum"}, {"data": {"entries": 6.0, "name": "x + 1", "sum": 12.399999999999999}, "type": "Sum"}, {"data": {"entries": 7.0, "name": "x + 1", "sum": 15.0}, "type": "Sum"}, {"data": {"entries": 8.0, "name": "x + 1", "sum": 16.0}, "type": "Sum"}, {"data": {"entries": 9.0, "name": "x + 1", "sum": 14.0}, "type": "Sum"}, {"data": {"entries": 10.0, "name": "x + 1", "sum": 13.3}, "type": "Sum"}]')
+EXPECTED_sumStruct = json.loads('[{"data": {"entries": 1.0, "sum": 4.4}, "type": "Sum"}, {"data": {"entries": 2.0, "sum": 7.6}, "type": "Sum"}, {"data": {"entries": 3.0, "sum": 6.8}, "type": "Sum"}, {"data": {"entries": 4.0, "sum": 7.8}, "type": "Sum"}, {"data": {"entries": 5.0, "sum": 16.1}, "type": "Sum"}, {"data": {"entries": 6.0, "sum": 12.399999999999999}, "type": "Sum"}, {"data": {"entries": 7.0, "sum": 15.0}, "type": "Sum"}, {"data": {"entries": 8.0, "sum": 16.0}, "type": "Sum"}, {"data": {"entries": 9.0, "sum": 14.0}, "type": "Sum"}, {"data": {"entries": 10.0, "sum": 13.3}, "type": "Sum"}]')
+EXPECTED_sumStructString = json.loads('[{"data": {"entries": 1.0, "name": "double + 1", "sum": 4.4}, "type": "Sum"}, {"data": {"entries": 2.0, "name": "double + 1", "sum": 7.6}, "type": "Sum"}, {"data": {"entries": 3.0, "name": "double + 1", "sum": 6.8}, "type": "Sum"}, {"data": {"entries": 4.0, "name": "double + 1", "sum": 7.8}, "type": "Sum"}, {"data": {"entries": 5.0, "name": "double + 1", "sum": 16.1}, "type": "Sum"}, {"data": {"entries": 6.0, "name": "double + 1", "sum": 12.399999999999999}, "type": "Sum"}, {"data": {"entries": 7.0, "name": "double + 1", "sum": 15.0}, "type": "Sum"}, {"data": {"entries": 8.0, "name": "double + 1", "sum": 16.0}, "type": "Sum"}, {"data": {"entries": 9.0, "name": "double + 1", "sum": 14.0}, "type": "Sum"}, {"data": {"entries": 10.0, "name": "double + 1", "sum": 13.3}, "type": "Sum"}]')
+EXPECTED_average = json.loads('[{"data": {"entries": 1, "mean": 3.4}, "type": "Average"}, {"data": {"entries": 2, "mean": 2.8}, "type": "Average"}, {"data": {"entries": 3, "mean": 1.2666666666666666}, "type": "Average"}, {"data": {"entries": 4, "mean": 0.95}, "type": "Average"}, {"data": {"entries": 5, "mean": 2.2199999999999998}, "type": "Average"}, {"data": {"entries": 6, "mean": 1.0666666666666667}, "type": "Average"}, {"data": {"entries": 7, "mean": 1.1428571428571428}, "type": "Average"}, {"data": {"entries": 8, "mean": 1.0}, "type": "Average"}, {"data": {"entries": 9, "mean": 0.5555555555555556}, "type": "Average"}, {"data": {"entries": 10, "mean": 0.32999999999999996}, "type": "Average"}]')
+
 class Struct(object):
     def __init__(self, x, y, z, w):
         self.bool = x
         self.int = y
         self.double = z
         self.string = w
+        self._repr = "Struct({}, {}, {}, {})".format(x, y, z, repr(w))
     def __repr__(self):
-        return "Struct({}, {}, {}, {})".format(self.bool, self.int, self.double, repr(self.string))
+        return self._repr
 
 def ed(x):
     return Factory.fromJson(x.toJson())
 
 class TestEverything(unittest.TestCase):
     def assertAlmostEqualJSON(self, x, y):
-        if isinstance(x, dict) and isinstance(y, dict):
-            if set(x.keys()) == set(y.keys()):
-                for k in x.keys():
-                    self.assertAlmostEqualJSON(x[k], y[k])
-            else:
-                raise AssertionError("keys {} are not equal to keys {}".format(sorted(x.keys()), sorted(y.keys())))
+        stack = [(x, y)]
+        while len(stack) > 0:
+            x, y = stack.pop()
 
-        elif isinstance(x, list) and isinstance(y, list):
-            if len(x) == len(y):
-                for xi, yi in zip(x, y):
-                    self.assertAlmostEqualJSON(xi, yi)
-            else:
-                raise AssertionError("length of {} is not equal to length of {}".format(x, y))
+            if isinstance(x, dict) and isinstance(y, dict):
+                if len(x) == len(y) and all(k in y for k in x):
+                    stack.extend((x[k], y[k]) for k in x)
+                else:
+                    raise AssertionError("keys {} are not equal to keys {}".format(sorted(x.keys()), sorted(y.keys())))
+
+            elif isinstance(x, list) and isinstance(y, list):
+                if len(x) == len(y):
+                    stack.extend(zip(x, y))
+                else:
+                    raise AssertionError("length of {} is not equal to length of {}".format(x, y))
 
-        elif isinstance(x, basestring) and isinstance(y, basestring):
-            self.assertEqual(x, y)
+            elif isinstance(x, stringTypes) and isinstance(y, stringTypes):
+                self.assertEqual(x, y)
 
-        elif isinstance(x, (int, long, float)) and isinstance(y, (int, long, float)):
-            self.assertAlmostEqual(x, y)
+            elif isinstance(x, numberTypes) and isinstance(y, numberTypes):
+                self.assertAlmostEqual(x, y)
 
-        else:
-            self.assertEqual(x, y)
+            else:
+                self.assertEqual(x, y)
 
     def test_count(self):
         x = Count()
-        self.assertEqual(x, x)
-        self.assertEqual(ed(x), ed(x))
-        self.assertEqual(hash(x), hash(x))
-        self.assertEqual(hash(ed(x)), hash(ed(x)))
-        self.assertEqual(x, x + x.zero())
-        self.assertEqual(ed(x), ed(x) + ed(x).zero())
-        self.assertEqual(ed(x + x), ed(x) + ed(x))
-        self.assertEqual(x, pickle.loads(pickle.dumps(x)))
-        self.assertEqual(ed(x), pickle.loads(pickle.dumps(ed(x))))
-        self.assertEqual(ed(x), ed(pickle.loads(pickle.dumps(x))))
+        def autoassertions():
+            e = ed(x)
+            self.assertEqual(x, x)
+            self.assertEqual(e, ed(x))
+            self.assertEqual(hash(x), hash(x))
+            self.assertEqual(hash(e), hash(ed(x)))
+            self.assertEqual(x, x + x.zero())
+            self.assertEqual(e, e + e.zero())
+            self.assertEqual(ed(x + x), e + e)
+            self.assertEqual(x, pickle.loads(pickle.dumps(x, pickle.HIGHEST_PROTOCOL)))
+            self.assertEqual(e, pickle.loads(pickle.dumps(e, pickle.HIGHEST_PROTOCOL)))
+            self.assertEqual(e, ed(pickle.loads(pickle.dumps(x, pickle.HIGHEST_PROTOCOL))))
+        autoassertions()
         x.fill(3.4)
-        self.assertAlmostEqualJSON(x.toJson(), {'data': 1.0, 'type': 'Count'})
-        self.assertEqual(x, x)
-        self.assertEqual(ed(x), ed(x))
-        self.assertEqual(hash(x), hash(x))
-        self.assertEqual(hash(ed(x)), hash(ed(x)))
-        self.assertEqual(x, x + x.zero())
-        self.assertEqual(ed(x), ed(x) + ed(x).zero())
-        self.assertEqual(ed(x + x), ed(x) + ed(x))
-        self.assertEqual(x, pickle.loads(pickle.dumps(x)))
-        self.assertEqual(ed(x), pickle.loads(pickle.dumps(ed(x))))
-        self.assertEqual(ed(x), ed(pickle.loads(pickle.dumps(x))))
+        self.assertAlmostEqualJSON(x.toJson(), EXPECTED_count[0])
+        autoassertions()
         x.fill(2.2)
-        self.assertAlmostEqualJSON(x.toJson(), {'data': 2.0, 'type': 'Count'})
-        self.assertEqual(x, x)
-        self.assertEqual(ed(x), ed(x))
-        self.assertEqual(hash(x), hash(x))
-        self.assertEqual(hash(ed(x)), hash(ed(x)))
-        self.assertEqual(x, x + x.zero())
-        self.assertEqual(ed(x), ed(x) + ed(x).zero())
-        self.assertEqual(ed(x + x), ed(x) + ed(x))
-        self.assertEqual(x, pickle.loads(pickle.dumps(x)))
-        self.assertEqual(ed(x), pickle.loads(pickle.dumps(ed(x))))
-        self.assertEqual(ed(x), ed(pickle.loads(pickle.dumps(x))))
+        self.assertAlmostEqualJSON(x.toJson(), EXPECTED_count[1])
+        autoassertions()
         x.fill(-1.8)
-        self.assertAlmostEqualJSON(x.toJson(), {'data': 3.0, 'type': 'Count'})
-        self.assertEqual(x, x)
-        self.assertEqual(ed(x), ed(x))
-        self.assertEqual(hash(x), hash(x))
-        self.assertEqual(hash(ed(x)), hash(ed(x)))
-        self.assertEqual(x, x + x.zero())
-        self.assertEqual(ed(x), ed(x) + ed(x).zero())
-        self.assertEqual(ed(x + x), ed(x) + ed(x))
-        self.assertEqual(x, pickle.loads(pickle.dumps(x)))
-        self.assertEqual(ed(x), pickle.loads(pickle.dumps(ed(x))))
-        self.assertEqual(ed(x), ed(pickle.loads(pickle.dumps(x))))
+        self.assertAlmostEqualJSON(x.toJson(), EXPECTED_count[2])
+        autoassertions()
         x.fill(0.0)
-        self.assertAlmostEqualJSON(x.toJson(), {'data': 4.0, 'type': 'Count'})
-        self.assertEqual(x, x)
-        self.assertEqual(ed(x), ed(x))
-        self.assertEqual(hash(x), hash(x))
-        self.assertEqual(hash(ed(x)), hash(ed(x)))
-        self.assertEqual(x, x + x.zero())
-        self.assertEqual(ed(x), ed(x) + ed(x).zero())
-        self.assertEqual(ed(x + x), ed(x) + ed(x))
-        self.assertEqual(x, pickle.loads(pickle.dumps(x)))
-        self.assertEqual(ed(x), pickle.loads(pickle.dumps(ed(x))))
-        self.assertEqual(ed(x), ed(pickle.loads(pickle.dumps(x))))
+        self.assertAlmostEqualJSON(x.toJson(), EXPECTED_count[3])
+        autoassertions()
         x.fill(7.3)
-        self.assertAlmostEqualJSON(x.toJson(), {'data': 5.0, 'type': 'Count'})
-        self.assertEqual(x, x)
-        self.assertEqual(ed(x), ed(x))
-        self.assertEqual(hash(x), hash(x))
-        self.assertEqual(hash(ed(x)), hash(ed(x)))
-        self.assertEqual(x, x + x.zero())
-        self.assertEqual(ed(x), ed(x) + ed(x).zero())
-        self.assertEqual(ed(x + x), ed(x) + ed(x))
-        self.assertEqual(x, pickle.loads(pickle.dumps(x)))
-        self.assertEqual(ed(x), pickle.loads(pickle.dumps(ed(x))))
-        self.assertEqual(ed(x), ed(pickle.loads(pickle.dumps(x))))
+        self.assertAlmostEqualJSON(x.toJson(), EXPECTED_count[4])
+        autoassertions()
         x.fill(-4.7)
-        self.assertAlmostEqualJSON(x.toJson(), {'data': 6.0, 'type': 'Count'})
-        self.assertEqual(x, x)
-        self.assertEqual(ed(x), ed(x))
-        self.assertEqual(hash(x), hash(x))
-        self.assertEqual(hash(ed(x)), hash(ed(x)))
-        self.assertEqual(x, x + x.zero())
-        self.assertEqual(ed(x), ed(x) + ed(x).zero())
-        self.assertEqual(ed(x + x), ed(x) + ed(x))
-        self.assertEqual(x, pickle.loads(pickle.dumps(x)))
-        self.assertEqual(ed(x), pickle.loads(pickle.dumps(ed(x))))
-        self.assertEqual(ed(x), ed(pickle.loads(pickle.dumps(x))))
+        self.assertAlmostEqualJSON(x.toJson(), EXPECTED_count[5])
+        autoassertions()
         x.fill(1.6)
-        self.assertAlmostEqualJSON(x.toJson(), {'data': 7.0, 'type': 'Count'})
-        self.assertEqual(x, x)
-        self.assertEqual(ed(x), ed(x))
-        self.assertEqual(hash(x), hash(x))
-        self.assertEqual(hash(ed(x)), hash(ed(x)))
-        self.assertEqual(x, x + x.zero())
-        self.assertEqual(ed(x), ed(x) + ed(x).zero())
-        self.assertEqual(ed(x + x), ed(x) + ed(x))
-        self.assertEqual(x, pickle.loads(pickle.dumps(x)))
-        self.assertEqual(ed(x), pickle.loads(pickle.dumps(ed(x))))
-        self.assertEqual(ed(x), ed(pickle.loads(pickle.dumps(x))))
+        self.assertAlmostEqualJSON(x.toJson(), EXPECTED_count[6])
+        autoassertions()
         x.fill(0.0)
-        self.assertAlmostEqualJSON(x.toJson(), {'data': 8.0, 'type': 'Count'})
-        self.assertEqual(x, x)
-        self.assertEqual(ed(x), ed(x))
-        self.assertEqual(hash(x), hash(x))
-        self.assertEqual(hash(ed(x)), hash(ed(x)))
-        self.assertEqual(x, x + x.zero())
-        self.assertEqual(ed(x), ed(x) + ed(x).zero())
-        self.assertEqual(ed(x + x), ed(x) + ed(x))
-        self.assertEqual(x, pickle.loads(pickle.dumps(x)))
-        self.assertEqual(ed(x), pickle.loads(pickle.dumps(ed(x))))
-        self.assertEqual(ed(x), ed(pickle.loads(pickle.dumps(x))))
+        self.assertAlmostEqualJSON(x.toJson(), EXPECTED_count[7])
+        autoassertions()
         x.fill(-3.0)
-        self.assertAlmostEqualJSON(x.toJson(), {'data': 9.0, 'type': 'Count'})
-        self.assertEqual(x, x)
-        self.assertEqual(ed(x), ed(x))
-        self.assertEqual(hash(x), hash(x))
-        self.assertEqual(hash(ed(x)), hash(ed(x)))
-        self.assertEqual(x, x + x.zero())
-        self.assertEqual(ed(x), ed(x) + ed(x).zero())
-        self.assertEqual(ed(x + x), ed(x) + ed(x))
-        self.assertEqual(x, pickle.loads(pickle.dumps(x)))
-        self.assertEqual(ed(x), pickle.loads(pickle.dumps(ed(x))))
-        self.assertEqual(ed(x), ed(pickle.loads(pickle.dumps(x))))
+        self.assertAlmostEqualJSON(x.toJson(), EXPECTED_count[8])
+        autoassertions()
         x.fill(-1.7)
-        self.assertAlmostEqualJSON(x.toJson(), {'data': 10.0, 'type': 'Count'})
+        self.assertAlmostEqualJSON(x.toJson(), EXPECTED_count[9])
 
     def test_weightedCount(self):
         x = Count()
-        self.assertEqual(x, x)
-        self.assertEqual(ed(x), ed(x))
-        self.assertEqual(hash(x), hash(x))
-        self.assertEqual(hash(ed(x)), hash(ed(x)))
-        self.assertEqual(x, x + x.zero())
-        self.assertEqual(ed(x), ed(x) + ed(x).zero())
-        self.assertEqual(ed(x + x), ed(x) + ed(x))
-        self.assertEqual(x, pickle.loads(pickle.dumps(x)))
-        self.assertEqual(ed(x), pickle.loads(pickle.dumps(ed(x))))
-        self.assertEqual(ed(x), ed(pickle.loads(pickle.dumps(x))))
+        def autoassertions():
+            e = ed(x)
+            self.assertEqual(x, x)
+            self.assertEqual(e, ed(x))
+            self.assertEqual(hash(x), hash(x))
+            self.assertEqual(hash(e), hash(ed(x)))
+            self.assertEqual(x, x + x.zero())
+            self.assertEqual(e, e + e.zero())
+            self.assertEqual(ed(x + x), e + e)
+            self.assertEqual(x, pickle.loads(pickle.dumps(x, pickle.HIGHEST_PROTOCOL)))
+            self.assertEqual(e, pickle.loads(pickle.dumps(e, pickle.HIGHEST_PROTOCOL)))
+            self.assertEqual(e, ed(pickle.loads(pickle.dumps(x, pickle.HIGHEST_PROTOCOL))))
+        autoassertions()
         x.fill(3.14, 3.4)
-        self.assertAlmostEqualJSON(x.toJson(), {'data': 3.4, 'type': 'Count'})
-        self.assertEqual(x, x)
-        self.assertEqual(ed(x), ed(x))
-        self.assertEqual(hash(x), hash(x))
-        self.assertEqual(hash(ed(x)), hash(ed(x)))
-        self.assertEqual(x, x + x.zero())
-        self.assertEqual(ed(x), ed(x) + ed(x).zero())
-        self.assertEqual(ed(x + x), ed(x) + ed(x))
-        self.assertEqual(x, pickle.loads(pickle.dumps(x)))
-        self.assertEqual(ed(x), pickle.loads(pickle.dumps(ed(x))))
-        self.assertEqual(ed(x), ed(pickle.loads(pickle.dumps(x))))
+        self.assertAlmostEqualJSON(x.toJson(), EXPECTED_weightedCount[0])
+        autoassertions()
         x.fill(3.14, 2.2)
-        self.assertAlmostEqualJSON(x.toJson(), {'data': 5.6, 'type': 'Count'})
-        self.assertEqual(x, x)
-        self.assertEqual(ed(x), ed(x))
-        self.assertEqual(hash(x), hash(x))
-        self.assertEqual(hash(ed(x)), hash(ed(x)))
-        self.assertEqual(x, x + x.zero())
-        self.assertEqual(ed(x), ed(x) + ed(x).zero())
-        self.assertEqual(ed(x + x), ed(x) + ed(x))
-        self.assertEqual(x, pickle.loads(pickle.dumps(x)))
-        self.assertEqual(ed(x), pickle.loads(pickle.dumps(ed(x))))
-        self.assertEqual(ed(x), ed(pickle.loads(pickle.dumps(x))))
+        self.assertAlmostEqualJSON(x.toJson(), EXPECTED_weightedCount[1])
+        autoassertions()
         x.fill(3.14, -1.8)
-        self.assertAlmostEqualJSON(x.toJson(), {'data': 5.6, 'type': 'Count'})
-        self.assertEqual(x, x)
-        self.assertEqual(ed(x), ed(x))
-        self.assertEqual(hash(x), hash(x))
-        self.assertEqual(hash(ed(x)), hash(ed(x)))
-        self.assertEqual(x, x + x.zero())
-        self.assertEqual(ed(x), ed(x) + ed(x).zero())
-        self.assertEqual(ed(x + x), ed(x) + ed(x))
-        self.assertEqual(x, pickle.loads(pickle.dumps(x)))
-        self.assertEqual(ed(x), pickle.loads(pickle.dumps(ed(x))))
-        self.assertEqual(ed(x), ed(pickle.loads(pickle.dumps(x))))
+        self.assertAlmostEqualJSON(x.toJson(), EXPECTED_weightedCount[2])
+        autoassertions()
         x.fill(3.14, 0.0)
-        self.assertAlmostEqualJSON(x.toJson(), {'data': 5.6, 'type': 'Count'})
-        self.assertEqual(x, x)
-        self.assertEqual(ed(x), ed(x))
-        self.assertEqual(hash(x), hash(x))
-        self.assertEqual(hash(ed(x)), hash(ed(x)))
-        self.assertEqual(x, x + x.zero())
-        self.assertEqual(ed(x), ed(x) + ed(x).zero())
-        self.assertEqual(ed(x + x), ed(x) + ed(x))
-        self.assertEqual(x, pickle.loads(pickle.dumps(x)))
-        self.assertEqual(ed(x), pickle.loads(pickle.dumps(ed(x))))
-        self.assertEqual(ed(x), ed(pickle.loads(pickle.dumps(x))))
+        self.assertAlmostEqualJSON(x.toJson(), EXPECTED_weightedCount[3])
+        autoassertions()
         x.fill(3.14, 7.3)
-        self.assertAlmostEqualJSON(x.toJson(), {'data': 12.899999999999999, 'type': 'Count'})
-        self.assertEqual(x, x)
-        self.assertEqual(ed(x), ed(x))
-        self.assertEqual(hash(x), hash(x))
-        self.assertEqual(hash(ed(x)), hash(ed(x)))
-        self.assertEqual(x, x + x.zero())
-        self.assertEqual(ed(x), ed(x) + ed(x).zero())
-        self.assertEqual(ed(x + x), ed(x) + ed(x))
-        self.assertEqual(x, pickle.loads(pickle.dumps(x)))
-        self.assertEqual(ed(x), pickle.loads(pickle.dumps(ed(x))))
-        self.assertEqual(ed(x), ed(pickle.loads(pickle.dumps(x))))
+        self.assertAlmostEqualJSON(x.toJson(), EXPECTED_weightedCount[4])
+        autoassertions()
         x.fill(3.14, -4.7)
-        self.assertAlmostEqualJSON(x.toJson(), {'data': 12.899999999999999, 'type': 'Count'})
-        self.assertEqual(x, x)
-        self.assertEqual(ed(x), ed(x))
-        self.assertEqual(hash(x), hash(x))
-        self.assertEqual(hash(ed(x)), hash(ed(x)))
-        self.assertEqual(x, x + x.zero())
-        self.assertEqual(ed(x), ed(x) + ed(x).zero())
-        self.assertEqual(ed(x + x), ed(x) + ed(x))
-        self.assertEqual(x, pickle.loads(pickle.dumps(x)))
-        self.assertEqual(ed(x), pickle.loads(pickle.dumps(ed(x))))
-        self.assertEqual(ed(x), ed(pickle.loads(pickle.dumps(x))))
+        self.assertAlmostEqualJSON(x.toJson(), EXPECTED_weightedCount[5])
+        autoassertions()
         x.fill(3.14, 1.6)
-        self.assertAlmostEqualJSON(x.toJson(), {'data': 14.499999999999998, 'type': 'Count'})
-        self.assertEqual(x, x)
-        self.assertEqual(ed(x), ed(x))
-        self.assertEqual(hash(x), hash(x))
-        self.assertEqual(hash(ed(x)), hash(ed(x)))
-        self.assertEqual(x, x + x.zero())
-        self.assertEqual(ed(x), ed(x) + ed(x).zero())
-        self.assertEqual(ed(x + x), ed(x) + ed(x))
-        self.assertEqual(x, pickle.loads(pickle.dumps(x)))
-        self.assertEqual(ed(x), pickle.loads(pickle.dumps(ed(x))))
-        self.assertEqual(ed(x), ed(pickle.loads(pickle.dumps(x))))
+        self.assertAlmostEqualJSON(x.toJson(), EXPECTED_weightedCount[6])
+        autoassertions()
         x.fill(3.14, 0.0)
-        self.assertAlmostEqualJSON(x.toJson(), {'data': 14.499999999999998, 'type': 'Count'})
-        self.assertEqual(x, x)
-        self.assertEqual(ed(x), ed(x))
-        self.assertEqual(hash(x), hash(x))
-        self.assertEqual(hash(ed(x)), hash(ed(x)))
-        self.assertEqual(x, x + x.zero())
-        self.assertEqual(ed(x), ed(x) + ed(x).zero())
-        self.assertEqual(ed(x + x), ed(x) + ed(x))
-        self.assertEqual(x, pickle.loads(pickle.dumps(x)))
-        self.assertEqual(ed(x), pickle.loads(pickle.dumps(ed(x))))
-        self.assertEqual(ed(x), ed(pickle.loads(pickle.dumps(x))))
+        self.assertAlmostEqualJSON(x.toJson(), EXPECTED_weightedCount[7])
+        autoassertions()
         x.fill(3.14, -3.0)
-        self.assertAlmostEqualJSON(x.toJson(), {'data': 14.499999999999998, 'type': 'Count'})
-        self.assertEqual(x, x)
-        self.assertEqual(ed(x), ed(x))
-        self.assertEqual(hash(x), hash(x))
-        self.assertEqual(hash(ed(x)), hash(ed(x)))
-        self.assertEqual(x, x + x.zero())
-        self.assertEqual(ed(x), ed(x) + ed(x).zero())
-        self.assertEqual(ed(x + x), ed(x) + ed(x))
-        self.assertEqual(x, pickle.loads(pickle.dumps(x)))
-        self.assertEqual(ed(x), pickle.loads(pickle.dumps(ed(x))))
-        self.assertEqual(ed(x), ed(pickle.loads(pickle.dumps(x))))
+        self.assertAlmostEqualJSON(x.toJson(), EXPECTED_weightedCount[8])
+        autoassertions()
         x.fill(3.14, -1.7)
-        self.assertAlmostEqualJSON(x.toJson(), {'data': 14.499999999999998, 'type': 'Count'})
+        self.assertAlmostEqualJSON(x.toJson(), EXPECTED_weightedCount[9])
 
     def test_summ(self):
         x = Sum(lambda x: x + 1)
-        self.assertEqual(x, x)
-        self.assertEqual(ed(x), ed(x))
-        self.assertEqual(hash(x), hash(x))
-        self.assertEqual(hash(ed(x)), hash(ed(x)))
-        self.assertEqual(x, x + x.zero())
-        self.assertEqual(ed(x), ed(x) + ed(x).zero())
-        self.assertEqual(ed(x + x), ed(x) + ed(x))
-        self.assertEqual(x, pickle.loads(pickle.dumps(x)))
-        self.assertEqual(ed(x), pickle.loads(pickle.dumps(ed(x))))
-        self.assertEqual(ed(x), ed(pickle.loads(pickle.dumps(x))))
+        def autoassertions():
+            e = ed(x)
+            self.assertEqual(x, x)
+            self.assertEqual(e, ed(x))
+            self.assertEqual(hash(x), hash(x))
+            self.assertEqual(hash(e), hash(ed(x)))
+            self.assertEqual(x, x + x.zero())
+            self.assertEqual(e, e + e.zero())
+            self.assertEqual(ed(x + x), e + e)
+            self.assertEqual(x, pickle.loads(pickle.dumps(x, pickle.HIGHEST_PROTOCOL)))
+            self.assertEqual(e, pickle.loads(pickle.dumps(e, pickle.HIGHEST_PROTOCOL)))
+            self.assertEqual(e, ed(pickle.loads(pickle.dumps(x, pickle.HIGHEST_PROTOCOL))))
+        autoassertions()
         x.fill(3.4)
-        self.assertAlmostEqualJSON(x.toJson(), {'data': {'sum': 4.4, 'entries': 1.0}, 'type': 'Sum'})
-        self.assertEqual(x, x)
-        self.assertEqual(ed(x), ed(x))
-        self.assertEqual(hash(x), hash(x))
-        self.assertEqual(hash(ed(x)), hash(ed(x)))
-        self.assertEqual(x, x + x.zero())
-        self.assertEqual(ed(x), ed(x) + ed(x).zero())
-        self.assertEqual(ed(x + x), ed(x) + ed(x))
-        self.assertEqual(x, pickle.loads(pickle.dumps(x)))
-        self.assertEqual(ed(x), pickle.loads(pickle.dumps(ed(x))))
-        self.assertEqual(ed(x), ed(pickle.loads(pickle.dumps(x))))
+        self.assertAlmostEqualJSON(x.toJson(), EXPECTED_summ[0])
+        autoassertions()
         x.fill(2.2)
-        self.assertAlmostEqualJSON(x.toJson(), {'data': {'sum': 7.6, 'entries': 2.0}, 'type': 'Sum'})
-        self.assertEqual(x, x)
-        self.assertEqual(ed(x), ed(x))
-        self.assertEqual(hash(x), hash(x))
-        self.assertEqual(hash(ed(x)), hash(ed(x)))
-        self.assertEqual(x, x + x.zero())
-        self.assertEqual(ed(x), ed(x) + ed(x).zero())
-        self.assertEqual(ed(x + x), ed(x) + ed(x))
-        self.assertEqual(x, pickle.loads(pickle.dumps(x)))
-        self.assertEqual(ed(x), pickle.loads(pickle.dumps(ed(x))))
-        self.assertEqual(ed(x), ed(pickle.loads(pickle.dumps(x))))
+        self.assertAlmostEqualJSON(x.toJson(), EXPECTED_summ[1])
+        autoassertions()
         x.fill(-1.8)
-        self.assertAlmostEqualJSON(x.toJson(), {'data': {'sum': 6.8, 'entries': 3.0}, 'type': 'Sum'})
-        self.assertEqual(x, x)
-        self.assertEqual(ed(x), ed(x))
-        self.assertEqual(hash(x), hash(x))
-        self.assertEqual(hash(ed(x)), hash(ed(x)))
-        self.assertEqual(x, x + x.zero())
-        self.assertEqual(ed(x), ed(x) + ed(x).zero())
-        self.assertEqual(ed(x + x), ed(x) + ed(x))
-        self.assertEqual(x, pickle.loads(pickle.dumps(x)))
-        self.assertEqual(ed(x), pickle.loads(pickle.dumps(ed(x))))
-        self.assertEqual(ed(x), ed(pickle.loads(pickle.dumps(x))))
+        self.assertAlmostEqualJSON(x.toJson(), EXPECTED_summ[2])
+        autoassertions()
         x.fill(0.0)
-        self.assertAlmostEqualJSON(x.toJson(), {'data': {'sum': 7.8, 'entries': 4.0}, 'type': 'Sum'})
-        self.assertEqual(x, x)
-        self.assertEqual(ed(x), ed(x))
-        self.assertEqual(hash(x), hash(x))
-        self.assertEqual(hash(ed(x)), hash(ed(x)))
-        self.assertEqual(x, x + x.zero())
-        self.assertEqual(ed(x), ed(x) + ed(x).zero())
-        self.assertEqual(ed(x + x), ed(x) + ed(x))
-        self.assertEqual(x, pickle.loads(pickle.dumps(x)))
-        self.assertEqual(ed(x), pickle.loads(pickle.dumps(ed(x))))
-        self.assertEqual(ed(x), ed(pickle.loads(pickle.dumps(x))))
+        self.assertAlmostEqualJSON(x.toJson(), EXPECTED_summ[3])
+        autoassertions()
         x.fill(7.3)
-        self.assertAlmostEqualJSON(x.toJson(), {'data': {'sum': 16.1, 'entries': 5.0}, 'type': 'Sum'})
-        self.assertEqual(x, x)
-        self.assertEqual(ed(x), ed(x))
-        self.assertEqual(hash(x), hash(x))
-        self.assertEqual(hash(ed(x)), hash(ed(x)))
-        self.assertEqual(x, x + x.zero())
-        self.assertEqual(ed(x), ed(x) + ed(x).zero())
-        self.assertEqual(ed(x + x), ed(x) + ed(x))
-        self.assertEqual(x, pickle.loads(pickle.dumps(x)))
-        self.assertEqual(ed(x), pickle.loads(pickle.dumps(ed(x))))
-        self.assertEqual(ed(x), ed(pickle.loads(pickle.dumps(x))))
+        self.assertAlmostEqualJSON(x.toJson(), EXPECTED_summ[4])
+        autoassertions()
         x.fill(-4.7)
-        self.assertAlmostEqualJSON(x.toJson(), {'data': {'sum': 12.399999999999999, 'entries': 6.0}, 'type': 'Sum'})
-        self.assertEqual(x, x)
-        self.assertEqual(ed(x), ed(x))
-        self.assertEqual(hash(x), hash(x))
-        self.assertEqual(hash(ed(x)), hash(ed(x)))
-        self.assertEqual(x, x + x.zero())
-        self.assertEqual(ed(x), ed(x) + ed(x).zero())
-        self.assertEqual(ed(x + x), ed(x) + ed(x))
-        self.assertEqual(x, pickle.loads(pickle.dumps(x)))
-        self.assertEqual(ed(x), pickle.loads(pickle.dumps(ed(x))))
-        self.assertEqual(ed(x), ed(pickle.loads(pickle.dumps(x))))
+        self.assertAlmostEqualJSON(x.toJson(), EXPECTED_summ[5])
+        autoassertions()
         x.fill(1.6)
-        self.assertAlmostEqualJSON(x.toJson(), {'data': {'sum': 15.0, 'entries': 7.0}, 'type': 'Sum'})
-        self.assertEqual(x, x)
-        self.assertEqual(ed(x), ed(x))
-        self.assertEqual(hash(x), hash(x))
-        self.assertEqual(hash(ed(x)), hash(ed(x)))
-        self.assertEqual(x, x + x.zero())
-        self.assertEqual(ed(x), ed(x) + ed(x).zero())
-        self.assertEqual(ed(x + x), ed(x) + ed(x))
-        self.assertEqual(x, pickle.loads(pickle.dumps(x)))
-        self.assertEqual(ed(x), pickle.loads(pickle.dumps(ed(x))))
-        self.assertEqual(ed(x), ed(pickle.loads(pickle.dumps(x))))
+        self.assertAlmostEqualJSON(x.toJson(), EXPECTED_summ[6])
+        autoassertions()
         x.fill(0.0)
-        self.assertAlmostEqualJSON(x.toJson(), {'data': {'sum': 16.0, 'entries': 8.0}, 'type': 'Sum'})
-        self.assertEqual(x, x)
-        self.assertEqual(ed(x), ed(x))
-        self.assertEqual(hash(x), hash(x))
-        self.assertEqual(hash(ed(x)), hash(ed(x)))
-        self.assertEqual(x, x + x.zero())
-        self.assertEqual(ed(x), ed(x) + ed(x).zero())
-        self.assertEqual(ed(x + x), ed(x) + ed(x))
-        self.assertEqual(x, pickle.loads(pickle.dumps(x)))
-        self.assertEqual(ed(x), pickle.loads(pickle.dumps(ed(x))))
-        self.assertEqual(ed(x), ed(pickle.loads(pickle.dumps(x))))
+        self.assertAlmostEqualJSON(x.toJson(), EXPECTED_summ[7])
+        autoassertions()
         x.fill(-3.0)
-        self.assertAlmostEqualJSON(x.toJson(), {'data': {'sum': 14.0, 'entries': 9.0}, 'type': 'Sum'})
-        self.assertEqual(x, x)
-        self.assertEqual(ed(x), ed(x))
-        self.assertEqual(hash(x), hash(x))
-        self.assertEqual(hash(ed(x)), hash(ed(x)))
-        self.assertEqual(x, x + x.zero())
-        self.assertEqual(ed(x), ed(x) + ed(x).zero())
-        self.assertEqual(ed(x + x), ed(x) + ed(x))
-        self.assertEqual(x, pickle.loads(pickle.dumps(x)))
-        self.assertEqual(ed(x), pickle.loads(pickle.dumps(ed(x))))
-        self.assertEqual(ed(x), ed(pickle.loads(pickle.dumps(x))))
+        self.assertAlmostEqualJSON(x.toJson(), EXPECTED_summ[8])
+        autoassertions()
         x.fill(-1.7)
-        self.assertAlmostEqualJSON(x.toJson(), {'data': {'sum': 13.3, 'entries': 10.0}, 'type': 'Sum'})
+        self.assertAlmostEqualJSON(x.toJson(), EXPECTED_summ[9])
 
     def test_sumWithName(self):
         x = Sum(named('something', lambda x: x + 1))
-        self.assertEqual(x, x)
-        self.assertEqual(ed(x), ed(x))
-        self.assertEqual(hash(x), hash(x))
-        self.assertEqual(hash(ed(x)), hash(ed(x)))
-        self.assertEqual(x, x + x.zero())
-        self.assertEqual(ed(x), ed(x) + ed(x).zero())
-        self.assertEqual(ed(x + x), ed(x) + ed(x))
-        self.assertEqual(x, pickle.loads(pickle.dumps(x)))
-        self.assertEqual(ed(x), pickle.loads(pickle.dumps(ed(x))))
-        self.assertEqual(ed(x), ed(pickle.loads(pickle.dumps(x))))
+        def autoassertions():
+            e = ed(x)
+            self.assertEqual(x, x)
+            self.assertEqual(e, ed(x))
+            self.assertEqual(hash(x), hash(x))
+            self.assertEqual(hash(e), hash(ed(x)))
+            self.assertEqual(x, x + x.zero())
+            self.assertEqual(e, e + e.zero())
+            self.assertEqual(ed(x + x), e + e)
+            self.assertEqual(x, pickle.loads(pickle.dumps(x, pickle.HIGHEST_PROTOCOL)))
+            self.assertEqual(e, pickle.loads(pickle.dumps(e, pickle.HIGHEST_PROTOCOL)))
+            self.assertEqual(e, ed(pickle.loads(pickle.dumps(x, pickle.HIGHEST_PROTOCOL))))
+        autoassertions()
         x.fill(3.4)
-        self.assertAlmostEqualJSON(x.toJson(), {'data': {'sum': 4.4, 'name': 'something', 'entries': 1.0}, 'type': 'Sum'})
-        self.assertEqual(x, x)
-        self.assertEqual(ed(x), ed(x))
-        self.assertEqual(hash(x), hash(x))
-        self.assertEqual(hash(ed(x)), hash(ed(x)))
-        self.assertEqual(x, x + x.zero())
-        self.assertEqual(ed(x), ed(x) + ed(x).zero())
-        self.assertEqual(ed(x + x), ed(x) + ed(x))
-        self.assertEqual(x, pickle.loads(pickle.dumps(x)))
-        self.assertEqual(ed(x), pickle.loads(pickle.dumps(ed(x))))
-        self.assertEqual(ed(x), ed(pickle.loads(pickle.dumps(x))))
+        self.assertAlmostEqualJSON(x.toJson(), EXPECTED_sumWithName[0])
+        autoassertions()
         x.fill(2.2)
-        self.assertAlmostEqualJSON(x.toJson(), {'data': {'sum': 7.6, 'name': 'something', 'entries': 2.0}, 'type': 'Sum'})
-        self.assertEqual(x, x)
-        self.assertEqual(ed(x), ed(x))
-        self.assertEqual(hash(x), hash(x))
-        self.assertEqual(hash(ed(x)), hash(ed(x)))
-        self.assertEqual(x, x + x.zero())
-        self.assertEqual(ed(x), ed(x) + ed(x).zero())
-        self.assertEqual(ed(x + x), ed(x) + ed(x))
-        self.assertEqual(x, pickle.loads(pickle.dumps(x)))
-        self.assertEqual(ed(x), pickle.loads(pickle.dumps(ed(x))))
-        self.assertEqual(ed(x), ed(pickle.loads(pickle.dumps(x))))
+        self.assertAlmostEqualJSON(x.toJson(), EXPECTED_sumWithName[1])
+        autoassertions()
         x.fill(-1.8)
-        self.assertAlmostEqualJSON(x.toJson(), {'data': {'sum': 6.8, 'name': 'something', 'entries': 3.0}, 'type': 'Sum'})
-        self.assertEqual(x, x)
-        self.assertEqual(ed(x), ed(x))
-        self.assertEqual(hash(x), hash(x))
-        self.assertEqual(hash(ed(x)), hash(ed(x)))
-        self.assertEqual(x, x + x.zero())
-        self.assertEqual(ed(x), ed(x) + ed(x).zero())
-        self.assertEqual(ed(x + x), ed(x) + ed(x))
-        self.assertEqual(x, pickle.loads(pickle.dumps(x)))
-        self.assertEqual(ed(x), pickle.loads(pickle.dumps(ed(x))))
-        self.assertEqual(ed(x), ed(pickle.loads(pickle.dumps(x))))
+        self.assertAlmostEqualJSON(x.toJson(), EXPECTED_sumWithName[2])
+        autoassertions()
         x.fill(0.0)
-        self.assertAlmostEqualJSON(x.toJson(), {'data': {'sum': 7.8, 'name': 'something', 'entries': 4.0}, 'type': 'Sum'})
-        self.assertEqual(x, x)
-        self.assertEqual(ed(x), ed(x))
-        self.assertEqual(hash(x), hash(x))
-        self.assertEqual(hash(ed(x)), hash(ed(x)))
-        self.assertEqual(x, x + x.zero())
-        self.assertEqual(ed(x), ed(x) + ed(x).zero())
-        self.assertEqual(ed(x + x), ed(x) + ed(x))
-        self.assertEqual(x, pickle.loads(pickle.dumps(x)))
-        self.assertEqual(ed(x), pickle.loads(pickle.dumps(ed(x))))
-        self.assertEqual(ed(x), ed(pickle.loads(pickle.dumps(x))))
+        self.assertAlmostEqualJSON(x.toJson(), EXPECTED_sumWithName[3])
+        autoassertions()
         x.fill(7.3)
-        self.assertAlmostEqualJSON(x.toJson(), {'data': {'sum': 16.1, 'name': 'something', 'entries': 5.0}, 'type': 'Sum'})
-        self.assertEqual(x, x)
-        self.assertEqual(ed(x), ed(x))
-        self.assertEqual(hash(x), hash(x))
-        self.assertEqual(hash(ed(x)), hash(ed(x)))
-        self.assertEqual(x, x + x.zero())
-        self.assertEqual(ed(x), ed(x) + ed(x).zero())
-        self.assertEqual(ed(x + x), ed(x) + ed(x))
-        self.assertEqual(x, pickle.loads(pickle.dumps(x)))
-        self.assertEqual(ed(x), pickle.loads(pickle.dumps(ed(x))))
-        self.assertEqual(ed(x), ed(pickle.loads(pickle.dumps(x))))
+        self.assertAlmostEqualJSON(x.toJson(), EXPECTED_sumWithName[4])
+        autoassertions()
         x.fill(-4.7)
-        self.assertAlmostEqualJSON(x.toJson(), {'data': {'sum': 12.399999999999999, 'name': 'something', 'entries': 6.0}, 'type': 'Sum'})
-        self.assertEqual(x, x)
-        self.assertEqual(ed(x), ed(x))
-        self.assertEqual(hash(x), hash(x))
-        self.assertEqual(hash(ed(x)), hash(ed(x)))
-        self.assertEqual(x, x + x.zero())
-        self.assertEqual(ed(x), ed(x) + ed(x).zero())
-        self.assertEqual(ed(x + x), ed(x) + ed(x))
-        self.assertEqual(x, pickle.loads(pickle.dumps(x)))
-        self.assertEqual(ed(x), pickle.loads(pickle.dumps(ed(x))))
-        self.assertEqual(ed(x), ed(pickle.loads(pickle.dumps(x))))
+        self.assertAlmostEqualJSON(x.toJson(), EXPECTED_sumWithName[5])
+        autoassertions()
         x.fill(1.6)
-        self.assertAlmostEqualJSON(x.toJson(), {'data': {'sum': 15.0, 'name': 'something', 'entries': 7.0}, 'type': 'Sum'})
-        self.assertEqual(x, x)
-        self.assertEqual(ed(x), ed(x))
-        self.assertEqual(hash(x), hash(x))
-        self.assertEqual(hash(ed(x)), hash(ed(x)))
-        self.assertEqual(x, x + x.zero())
-        self.assertEqual(ed(x), ed(x) + ed(x).zero())
-        self.assertEqual(ed(x + x), ed(x) + ed(x))
-        self.assertEqual(x, pickle.loads(pickle.dumps(x)))
-        self.assertEqual(ed(x), pickle.loads(pickle.dumps(ed(x))))
-        self.assertEqual(ed(x), ed(pickle.loads(pickle.dumps(x))))
+        self.assertAlmostEqualJSON(x.toJson(), EXPECTED_sumWithName[6])
+        autoassertions()
         x.fill(0.0)
-        self.assertAlmostEqualJSON(x.toJson(), {'data': {'sum': 16.0, 'name': 'something', 'entries': 8.0}, 'type': 'Sum'})
-        self.assertEqual(x, x)
-        self.assertEqual(ed(x), ed(x))
-        self.assertEqual(hash(x), hash(x))
-        self.assertEqual(hash(ed(x)), hash(ed(x)))
-        self.assertEqual(x, x + x.zero())
-        self.assertEqual(ed(x), ed(x) + ed(x).zero())
-        self.assertEqual(ed(x + x), ed(x) + ed(x))
-        self.assertEqual(x, pickle.loads(pickle.dumps(x)))
-        self.assertEqual(ed(x), pickle.loads(pickle.dumps(ed(x))))
-        self.assertEqual(ed(x), ed(pickle.loads(pickle.dumps(x))))
+        self.assertAlmostEqualJSON(x.toJson(), EXPECTED_sumWithName[7])
+        autoassertions()
         x.fill(-3.0)
-        self.assertAlmostEqualJSON(x.toJson(), {'data': {'sum': 14.0, 'name': 'something', 'entries': 9.0}, 'type': 'Sum'})
-        self.assertEqual(x, x)
-        self.assertEqual(ed(x), ed(x))
-        self.assertEqual(hash(x), hash(x))
-        self.assertEqual(hash(ed(x)), hash(ed(x)))
-        self.assertEqual(x, x + x.zero())
-        self.assertEqual(ed(x), ed(x) + ed(x).zero())
-        self.assertEqual(ed(x + x), ed(x) + ed(x))
-        self.assertEqual(x, pickle.loads(pickle.dumps(x)))
-        self.assertEqual(ed(x), pickle.loads(pickle.dumps(ed(x))))
-        self.assertEqual(ed(x), ed(pickle.loads(pickle.dumps(x))))
+        self.assertAlmostEqualJSON(x.toJson(), EXPECTED_sumWithName[8])
+        autoassertions()
         x.fill(-1.7)
-        self.assertAlmostEqualJSON(x.toJson(), {'data': {'sum': 13.3, 'name': 'something', 'entries': 10.0}, 'type': 'Sum'})
+        self.assertAlmostEqualJSON(x.toJson(), EXPECTED_sumWithName[9])
 
     def test_sumString(self):
         x = Sum('x + 1')
-        self.assertEqual(x, x)
-        self.assertEqual(ed(x), ed(x))
-        self.assertEqual(hash(x), hash(x))
-        self.assertEqual(hash(ed(x)), hash(ed(x)))
-        self.assertEqual(x, x + x.zero())
-        self.assertEqual(ed(x), ed(x) + ed(x).zero())
-        self.assertEqual(ed(x + x), ed(x) + ed(x))
-        self.assertEqual(x, pickle.loads(pickle.dumps(x)))
-        self.assertEqual(ed(x), pickle.loads(pickle.dumps(ed(x))))
-        self.assertEqual(ed(x), ed(pickle.loads(pickle.dumps(x))))
+        def autoassertions():
+            e = ed(x)
+            self.assertEqual(x, x)
+            self.assertEqual(e, ed(x))
+            self.assertEqual(hash(x), hash(x))
+            self.assertEqual(hash(e), hash(ed(x)))
+            self.assertEqual(x, x + x.zero())
+            self.assertEqual(e, e + e.zero())
+            self.assertEqual(ed(x + x), e + e)
+            self.assertEqual(x, pickle.loads(pickle.dumps(x, pickle.HIGHEST_PROTOCOL)))
+            self.assertEqual(e, pickle.loads(pickle.dumps(e, pickle.HIGHEST_PROTOCOL)))
+            self.assertEqual(e, ed(pickle.loads(pickle.dumps(x, pickle.HIGHEST_PROTOCOL))))
+        autoassertions()
         x.fill(3.4)
-        self.assertAlmostEqualJSON(x.toJson(), {'data': {'sum': 4.4, 'name': 'x + 1', 'entries': 1.0}, 'type': 'Sum'})
-        self.assertEqual(x, x)
-        self.assertEqual(ed(x), ed(x))
-        self.assertEqual(hash(x), hash(x))
-        self.assertEqual(hash(ed(x)), hash(ed(x)))
-        self.assertEqual(x, x + x.zero())
-        self.assertEqual(ed(x), ed(x) + ed(x).zero())
-        self.assertEqual(ed(x + x), ed(x) + ed(x))
-        self.assertEqual(x, pickle.loads(pickle.dumps(x)))
-        self.assertEqual(ed(x), pickle.loads(pickle.dumps(ed(x))))
-        self.assertEqual(ed(x), ed(pickle.loads(pickle.dumps(x))))
+        self.assertAlmostEqualJSON(x.toJson(), EXPECTED_sumString[0])
+        autoassertions()
         x.fill(2.2)
-        self.assertAlmostEqualJSON(x.toJson(), {'data': {'sum': 7.6, 'name': 'x + 1', 'entries': 2.0}, 'type': 'Sum'})
-        self.assertEqual(x, x)
-        self.assertEqual(ed(x), ed(x))
-        self.assertEqual(hash(x), hash(x))
-        self.assertEqual(hash(ed(x)), hash(ed(x)))
-        self.assertEqual(x, x + x.zero())
-        self.assertEqual(ed(x), ed(x) + ed(x).zero())
-        self.assertEqual(ed(x + x), ed(x) + ed(x))
-        self.assertEqual(x, pickle.loads(pickle.dumps(x)))
-        self.assertEqual(ed(x), pickle.loads(pickle.dumps(ed(x))))
-        self.assertEqual(ed(x), ed(pickle.loads(pickle.dumps(x))))
+        self.assertAlmostEqualJSON(x.toJson(), EXPECTED_sumString[1])
+        autoassertions()
         x.fill(-1.8)
-        self.assertAlmostEqualJSON(x.toJson(), {'data': {'sum': 6.8, 'name': 'x + 1', 'entries': 3.0}, 'type': 'Sum'})
-        self.assertEqual(x, x)
-        self.assertEqual(ed(x), ed(x))
-        self.assertEqual(hash(x), hash(x))
-        self.assertEqual(hash(ed(x)), hash(ed(x)))
-        self.assertEqual(x, x + x.zero())
-        self.assertEqual(ed(x), ed(x) + ed(x).zero())
-        self.assertEqual(ed(x + x), ed(x) + ed(x))
-        self.assertEqual(x, pickle.loads(pickle.dumps(x)))
-        self.assertEqual(ed(x), pickle.loads(pickle.dumps(ed(x))))
-        self.assertEqual(ed(x), ed(pickle.loads(pickle.dumps(x))))
+        self.assertAlmostEqualJSON(x.toJson(), EXPECTED_sumString[2])
+        autoassertions()
         x.fill(0.0)
-        self.assertAlmostEqualJSON(x.toJson(), {'data': {'sum': 7.8, 'name': 'x + 1', 'entries': 4.0}, 'type': 'Sum'})
-        self.assertEqual(x, x)
-        self.assertEqual(ed(x), ed(x))
-        self.assertEqual(hash(x), hash(x))
-        self.assertEqual(hash(ed(x)), hash(ed(x)))
-        self.assertEqual(x, x + x.zero())
-        self.assertEqual(ed(x), ed(x) + ed(x).zero())
-        self.assertEqual(ed(x + x), ed(x) + ed(x))
-        self.assertEqual(x, pickle.loads(pickle.dumps(x)))
-        self.assertEqual(ed(x), pickle.loads(pickle.dumps(ed(x))))
-        self.assertEqual(ed(x), ed(pickle.loads(pickle.dumps(x))))
+        self.assertAlmostEqualJSON(x.toJson(), EXPECTED_sumString[3])
+        autoassertions()
         x.fill(7.3)
-        self.assertAlmostEqualJSON(x.toJson(), {'data': {'sum': 16.1, 'name': 'x + 1', 'entries': 5.0}, 'type': 'Sum'})
-        self.assertEqual(x, x)
-        self.assertEqual(ed(x), ed(x))
-        self.assertEqual(hash(x), hash(x))
-        self.assertEqual(hash(ed(x)), hash(ed(x)))
-        self.assertEqual(x, x + x.zero())
-        self.assertEqual(ed(x), ed(x) + ed(x).zero())
-        self.assertEqual(ed(x + x), ed(x) + ed(x))
-        self.assertEqual(x, pickle.loads(pickle.dumps(x)))
-        self.assertEqual(ed(x), pickle.loads(pickle.dumps(ed(x))))
-        self.assertEqual(ed(x), ed(pickle.loads(pickle.dumps(x))))
+        self.assertAlmostEqualJSON(x.toJson(), EXPECTED_sumString[4])
+        autoassertions()
         x.fill(-4.7)
-        self.assertAlmostEqualJSON(x.toJson(), {'data': {'sum': 12.399999999999999, 'name': 'x + 1', 'entries': 6.0}, 'type': 'Sum'})
-        self.assertEqual(x, x)
-        self.assertEqual(ed(x), ed(x))
-        self.assertEqual(hash(x), hash(x))
-        self.assertEqual(hash(ed(x)), hash(ed(x)))
-        self.assertEqual(x, x + x.zero())
-        self.assertEqual(ed(x), ed(x) + ed(x).zero())
-        self.assertEqual(ed(x + x), ed(x) + ed(x))
-        self.assertEqual(x, pickle.loads(pickle.dumps(x)))
-        self.assertEqual(ed(x), pickle.loads(pickle.dumps(ed(x))))
-        self.assertEqual(ed(x), ed(pickle.loads(pickle.dumps(x))))
+        self.assertAlmostEqualJSON(x.toJson(), EXPECTED_sumString[5])
+        autoassertions()
         x.fill(1.6)
-        self.assertAlmostEqualJSON(x.toJson(), {'data': {'sum': 15.0, 'name': 'x + 1', 'entries': 7.0}, 'type': 'Sum'})
-        self.assertEqual(x, x)
-        self.assertEqual(ed(x), ed(x))
-        self.assertEqual(hash(x), hash(x))
-        self.assertEqual(hash(ed(x)), hash(ed(x)))
-        self.assertEqual(x, x + x.zero())
-        self.assertEqual(ed(x), ed(x) + ed(x).zero())
-        self.assertEqual(ed(x + x), ed(x) + ed(x))
-        self.assertEqual(x, pickle.loads(pickle.dumps(x)))
-        self.assertEqual(ed(x), pickle.loads(pickle.dumps(ed(x))))
-        self.assertEqual(ed(x), ed(pickle.loads(pickle.dumps(x))))
+        self.assertAlmostEqualJSON(x.toJson(), EXPECTED_sumString[6])
+        autoassertions()
         x.fill(0.0)
-        self.assertAlmostEqualJSON(x.toJson(), {'data': {'sum': 16.0, 'name': 'x + 1', 'entries': 8.0}, 'type': 'Sum'})
-        self.assertEqual(x, x)
-        self.assertEqual(ed(x), ed(x))
-        self.assertEqual(hash(x), hash(x))
-        self.assertEqual(hash(ed(x)), hash(ed(x)))
-        self.assertEqual(x, x + x.zero())
-        self.assertEqual(ed(x), ed(x) + ed(x).zero())
-        self.assertEqual(ed(x + x), ed(x) + ed(x))
-        self.assertEqual(x, pickle.loads(pickle.dumps(x)))
-        self.assertEqual(ed(x), pickle.loads(pickle.dumps(ed(x))))
-        self.assertEqual(ed(x), ed(pickle.loads(pickle.dumps(x))))
+        self.assertAlmostEqualJSON(x.toJson(), EXPECTED_sumString[7])
+        autoassertions()
         x.fill(-3.0)
-        self.assertAlmostEqualJSON(x.toJson(), {'data': {'sum': 14.0, 'name': 'x + 1', 'entries': 9.0}, 'type': 'Sum'})
-        self.assertEqual(x, x)
-        self.assertEqual(ed(x), ed(x))
-        self.assertEqual(hash(x), hash(x))
-        self.assertEqual(hash(ed(x)), hash(ed(x)))
-        self.assertEqual(x, x + x.zero())
-        self.assertEqual(ed(x), ed(x) + ed(x).zero())
-        self.assertEqual(ed(x + x), ed(x) + ed(x))
-        self.assertEqual(x, pickle.loads(pickle.dumps(x)))
-        self.assertEqual(ed(x), pickle.loads(pickle.dumps(ed(x))))
-        self.assertEqual(ed(x), ed(pickle.loads(pickle.dumps(x))))
+        self.assertAlmostEqualJSON(x.toJson(), EXPECTED_sumString[8])
+        autoassertions()
         x.fill(-1.7)
-        self.assertAlmostEqualJSON(x.toJson(), {'data': {'sum': 13.3, 'name': 'x + 1', 'entries': 10.0}, 'type': 'Sum'})
+        self.assertAlmostEqualJSON(x.toJson(), EXPECTED_sumString[9])
 
     def test_sumStruct(self):
         x = Sum(lambda x: x.double + 1)
-        self.assertEqual(x, x)
-        self.assertEqual(ed(x), ed(x))
-        self.assertEqual(hash(x), hash(x))
-        self.assertEqual(hash(ed(x)), hash(ed(x)))
-        self.assertEqual(x, x + x.zero())
-        self.assertEqual(ed(x), ed(x) + ed(x).zero())
-        self.assertEqual(ed(x + x), ed(x) + ed(x))
-        self.assertEqual(x, pickle.loads(pickle.dumps(x)))
-        self.assertEqual(ed(x), pickle.loads(pickle.dumps(ed(x))))
-        self.assertEqual(ed(x), ed(pickle.loads(pickle.dumps(x))))
+        def autoassertions():
+            e = ed(x)
+            self.assertEqual(x, x)
+            self.assertEqual(e, ed(x))
+            self.assertEqual(hash(x), hash(x))
+            self.assertEqual(hash(e), hash(ed(x)))
+            self.assertEqual(x, x + x.zero())
+            self.assertEqual(e, e + e.zero())
+            self.assertEqual(ed(x + x), e + e)
+            self.assertEqual(x, pickle.loads(pickle.dumps(x, pickle.HIGHEST_PROTOCOL)))
+            self.assertEqual(e, pickle.loads(pickle.dumps(e, pickle.HIGHEST_PROTOCOL)))
+            self.assertEqual(e, ed(pickle.loads(pickle.dumps(x, pickle.HIGHEST_PROTOCOL))))
+        autoassertions()
         x.fill(Struct(True, -2, 3.4, 'one'))
-        self.assertAlmostEqualJSON(x.toJson(), {'data': {'sum': 4.4, 'entries': 1.0}, 'type': 'Sum'})
-        self.assertEqual(x, x)
-        self.assertEqual(ed(x), ed(x))
-        self.assertEqual(hash(x), hash(x))
-        self.assertEqual(hash(ed(x)), hash(ed(x)))
-        self.assertEqual(x, x + x.zero())
-        self.assertEqual(ed(x), ed(x) + ed(x).zero())
-        self.assertEqual(ed(x + x), ed(x) + ed(x))
-        self.assertEqual(x, pickle.loads(pickle.dumps(x)))
-        self.assertEqual(ed(x), pickle.loads(pickle.dumps(ed(x))))
-        self.assertEqual(ed(x), ed(pickle.loads(pickle.dumps(x))))
+        self.assertAlmostEqualJSON(x.toJson(), EXPECTED_sumStruct[0])
+        autoassertions()
         x.fill(Struct(False, -1, 2.2, 'two'))
-        self.assertAlmostEqualJSON(x.toJson(), {'data': {'sum': 7.6, 'entries': 2.0}, 'type': 'Sum'})
-        self.assertEqual(x, x)
-        self.assertEqual(ed(x), ed(x))
-        self.assertEqual(hash(x), hash(x))
-        self.assertEqual(hash(ed(x)), hash(ed(x)))
-        self.assertEqual(x, x + x.zero())
-        self.assertEqual(ed(x), ed(x) + ed(x).zero())
-        self.assertEqual(ed(x + x), ed(x) + ed(x))
-        self.assertEqual(x, pickle.loads(pickle.dumps(x)))
-        self.assertEqual(ed(x), pickle.loads(pickle.dumps(ed(x))))
-        self.assertEqual(ed(x), ed(pickle.loads(pickle.dumps(x))))
+        self.assertAlmostEqualJSON(x.toJson(), EXPECTED_sumStruct[1])
+        autoassertions()
         x.fill(Struct(True, 0, -1.8, 'three'))
-        self.assertAlmostEqualJSON(x.toJson(), {'data': {'sum': 6.8, 'entries': 3.0}, 'type': 'Sum'})
-        self.assertEqual(x, x)
-        self.assertEqual(ed(x), ed(x))
-        self.assertEqual(hash(x), hash(x))
-        self.assertEqual(hash(ed(x)), hash(ed(x)))
-        self.assertEqual(x, x + x.zero())
-        self.assertEqual(ed(x), ed(x) + ed(x).zero())
-        self.assertEqual(ed(x + x), ed(x) + ed(x))
-        self.assertEqual(x, pickle.loads(pickle.dumps(x)))
-        self.assertEqual(ed(x), pickle.loads(pickle.dumps(ed(x))))
-        self.assertEqual(ed(x), ed(pickle.loads(pickle.dumps(x))))
+        self.assertAlmostEqualJSON(x.toJson(), EXPECTED_sumStruct[2])
+        autoassertions()
         x.fill(Struct(False, 1, 0.0, 'four'))
-        self.assertAlmostEqualJSON(x.toJson(), {'data': {'sum': 7.8, 'entries': 4.0}, 'type': 'Sum'})
-        self.assertEqual(x, x)
-        self.assertEqual(ed(x), ed(x))
-        self.assertEqual(hash(x), hash(x))
-        self.assertEqual(hash(ed(x)), hash(ed(x)))
-        self.assertEqual(x, x + x.zero())
-        self.assertEqual(ed(x), ed(x) + ed(x).zero())
-        self.assertEqual(ed(x + x), ed(x) + ed(x))
-        self.assertEqual(x, pickle.loads(pickle.dumps(x)))
-        self.assertEqual(ed(x), pickle.loads(pickle.dumps(ed(x))))
-        self.assertEqual(ed(x), ed(pickle.loads(pickle.dumps(x))))
+        self.assertAlmostEqualJSON(x.toJson(), EXPECTED_sumStruct[3])
+        autoassertions()
         x.fill(Struct(False, 2, 7.3, 'five'))
-        self.assertAlmostEqualJSON(x.toJson(), {'data': {'sum': 16.1, 'entries': 5.0}, 'type': 'Sum'})
-        self.assertEqual(x, x)
-        self.assertEqual(ed(x), ed(x))
-        self.assertEqual(hash(x), hash(x))
-        self.assertEqual(hash(ed(x)), hash(ed(x)))
-        self.assertEqual(x, x + x.zero())
-        self.assertEqual(ed(x), ed(x) + ed(x).zero())
-        self.assertEqual(ed(x + x), ed(x) + ed(x))
-        self.assertEqual(x, pickle.loads(pickle.dumps(x)))
-        self.assertEqual(ed(x), pickle.loads(pickle.dumps(ed(x))))
-        self.assertEqual(ed(x), ed(pickle.loads(pickle.dumps(x))))
+        self.assertAlmostEqualJSON(x.toJson(), EXPECTED_sumStruct[4])
+        autoassertions()
         x.fill(Struct(False, 3, -4.7, 'six'))
-        self.assertAlmostEqualJSON(x.toJson(), {'data': {'sum': 12.399999999999999, 'entries': 6.0}, 'type': 'Sum'})
-        self.assertEqual(x, x)
-        self.assertEqual(ed(x), ed(x))
-        self.assertEqual(hash(x), hash(x))
-        self.assertEqual(hash(ed(x)), hash(ed(x)))
-        self.assertEqual(x, x + x.zero())
-        self.assertEqual(ed(x), ed(x) + ed(x).zero())
-        self.assertEqual(ed(x + x), ed(x) + ed(x))
-        self.assertEqual(x, pickle.loads(pickle.dumps(x)))
-        self.assertEqual(ed(x), pickle.loads(pickle.dumps(ed(x))))
-        self.assertEqual(ed(x), ed(pickle.loads(pickle.dumps(x))))
+        self.assertAlmostEqualJSON(x.toJson(), EXPECTED_sumStruct[5])
+        autoassertions()
         x.fill(Struct(True, 4, 1.6, 'seven'))
-        self.assertAlmostEqualJSON(x.toJson(), {'data': {'sum': 15.0, 'entries': 7.0}, 'type': 'Sum'})
-        self.assertEqual(x, x)
-        self.assertEqual(ed(x), ed(x))
-        self.assertEqual(hash(x), hash(x))
-        self.assertEqual(hash(ed(x)), hash(ed(x)))
-        self.assertEqual(x, x + x.zero())
-        self.assertEqual(ed(x), ed(x) + ed(x).zero())
-        self.assertEqual(ed(x + x), ed(x) + ed(x))
-        self.assertEqual(x, pickle.loads(pickle.dumps(x)))
-        self.assertEqual(ed(x), pickle.loads(pickle.dumps(ed(x))))
-        self.assertEqual(ed(x), ed(pickle.loads(pickle.dumps(x))))
+        self.assertAlmostEqualJSON(x.toJson(), EXPECTED_sumStruct[6])
+        autoassertions()
         x.fill(Struct(True, 5, 0.0, 'eight'))
-        self.assertAlmostEqualJSON(x.toJson(), {'data': {'sum': 16.0, 'entries': 8.0}, 'type': 'Sum'})
-        self.assertEqual(x, x)
-        self.assertEqual(ed(x), ed(x))
-        self.assertEqual(hash(x), hash(x))
-        self.assertEqual(hash(ed(x)), hash(ed(x)))
-        self.assertEqual(x, x + x.zero())
-        self.assertEqual(ed(x), ed(x) + ed(x).zero())
-        self.assertEqual(ed(x + x), ed(x) + ed(x))
-        self.assertEqual(x, pickle.loads(pickle.dumps(x)))
-        self.assertEqual(ed(x), pickle.loads(pickle.dumps(ed(x))))
-        self.assertEqual(ed(x), ed(pickle.loads(pickle.dumps(x))))
+        self.assertAlmostEqualJSON(x.toJson(), EXPECTED_sumStruct[7])
+        autoassertions()
         x.fill(Struct(False, 6, -3.0, 'nine'))
-        self.assertAlmostEqualJSON(x.toJson(), {'data': {'sum': 14.0, 'entries': 9.0}, 'type': 'Sum'})
-        self.assertEqual(x, x)
-        self.assertEqual(ed(x), ed(x))
-        self.assertEqual(hash(x), hash(x))
-        self.assertEqual(hash(ed(x)), hash(ed(x)))
-        self.assertEqual(x, x + x.zero())
-        self.assertEqual(ed(x), ed(x) + ed(x).zero())
-        self.assertEqual(ed(x + x), ed(x) + ed(x))
-        self.assertEqual(x, pickle.loads(pickle.dumps(x)))
-        self.assertEqual(ed(x), pickle.loads(pickle.dumps(ed(x))))
-        self.assertEqual(ed(x), ed(pickle.loads(pickle.dumps(x))))
+        self.assertAlmostEqualJSON(x.toJson(), EXPECTED_sumStruct[8])
+        autoassertions()
         x.fill(Struct(True, 7, -1.7, 'ten'))
-        self.assertAlmostEqualJSON(x.toJson(), {'data': {'sum': 13.3, 'entries': 10.0}, 'type': 'Sum'})
+        self.assertAlmostEqualJSON(x.toJson(), EXPECTED_sumStruct[9])
 
     def test_sumStructString(self):
         x = Sum('double + 1')
-        self.assertEqual(x, x)
-        self.assertEqual(ed(x), ed(x))
-        self.assertEqual(hash(x), hash(x))
-        self.assertEqual(hash(ed(x)), hash(ed(x)))
-        self.assertEqual(x, x + x.zero())
-        self.assertEqual(ed(x), ed(x) + ed(x).zero())
-        self.assertEqual(ed(x + x), ed(x) + ed(x))
-        self.assertEqual(x, pickle.loads(pickle.dumps(x)))
-        self.assertEqual(ed(x), pickle.loads(pickle.dumps(ed(x))))
-        self.assertEqual(ed(x), ed(pickle.loads(pickle.dumps(x))))
+        def autoassertions():
+            e = ed(x)
+            self.assertEqual(x, x)
+            self.assertEqual(e, ed(x))
+            self.assertEqual(hash(x), hash(x))
+            self.assertEqual(hash(e), hash(ed(x)))
+            self.assertEqual(x, x + x.zero())
+            self.assertEqual(e, e + e.zero())
+            self.assertEqual(ed(x + x), e + e)
+            self.assertEqual(x, pickle.loads(pickle.dumps(x, pickle.HIGHEST_PROTOCOL)))
+            self.assertEqual(e, pickle.loads(pickle.dumps(e, pickle.HIGHEST_PROTOCOL)))
+            self.assertEqual(e, ed(pickle.loads(pickle.dumps(x, pickle.HIGHEST_PROTOCOL))))
+        autoassertions()
         x.fill(Struct(True, -2, 3.4, 'one'))
-        self.assertAlmostEqualJSON(x.toJson(), {'data': {'sum': 4.4, 'name': 'double + 1', 'entries': 1.0}, 'type': 'Sum'})
-        self.assertEqual(x, x)
-        self.assertEqual(ed(x), ed(x))
-        self.assertEqual(hash(x), hash(x))
-        self.assertEqual(hash(ed(x)), hash(ed(x)))
-        self.assertEqual(x, x + x.zero())
-        self.assertEqual(ed(x), ed(x) + ed(x).zero())
-        self.assertEqual(ed(x + x), ed(x) + ed(x))
-        self.assertEqual(x, pickle.loads(pickle.dumps(x)))
-        self.assertEqual(ed(x), pickle.loads(pickle.dumps(ed(x))))
-        self.assertEqual(ed(x), ed(pickle.loads(pickle.dumps(x))))
+        self.assertAlmostEqualJSON(x.toJson(), EXPECTED_sumStructString[0])
+        autoassertions()
         x.fill(Struct(False, -1, 2.2, 'two'))
-        self.assertAlmostEqualJSON(x.toJson(), {'data': {'sum': 7.6, 'name': 'double + 1', 'entries': 2.0}, 'type': 'Sum'})
-        self.assertEqual(x, x)
-        self.assertEqual(ed(x), ed(x))
-        self.assertEqual(hash(x), hash(x))
-        self.assertEqual(hash(ed(x)), hash(ed(x)))
-        self.assertEqual(x, x + x.zero())
-        self.assertEqual(ed(x), ed(x) + ed(x).zero())
-        self.assertEqual(ed(x + x), ed(x) + ed(x))
-        self.assertEqual(x, pickle.loads(pickle.dumps(x)))
-        self.assertEqual(ed(x), pickle.loads(pickle.dumps(ed(x))))
-        self.assertEqual(ed(x), ed(pickle.loads(pickle.dumps(x))))
+        self.assertAlmostEqualJSON(x.toJson(), EXPECTED_sumStructString[1])
+        autoassertions()
         x.fill(Struct(True, 0, -1.8, 'three'))
-        self.assertAlmostEqualJSON(x.toJson(), {'data': {'sum': 6.8, 'name': 'double + 1', 'entries': 3.0}, 'type': 'Sum'})
-        self.assertEqual(x, x)
-        self.assertEqual(ed(x), ed(x))
-        self.assertEqual(hash(x), hash(x))
-        self.assertEqual(hash(ed(x)), hash(ed(x)))
-        self.assertEqual(x, x + x.zero())
-        self.assertEqual(ed(x), ed(x) + ed(x).zero())
-        self.assertEqual(ed(x + x), ed(x) + ed(x))
-        self.assertEqual(x, pickle.loads(pickle.dumps(x)))
-        self.assertEqual(ed(x), pickle.loads(pickle.dumps(ed(x))))
-        self.assertEqual(ed(x), ed(pickle.loads(pickle.dumps(x))))
+        self.assertAlmostEqualJSON(x.toJson(), EXPECTED_sumStructString[2])
+        autoassertions()
         x.fill(Struct(False, 1, 0.0, 'four'))
-        self.assertAlmostEqualJSON(x.toJson(), {'data': {'sum': 7.8, 'name': 'double + 1', 'entries': 4.0}, 'type': 'Sum'})
-        self.assertEqual(x, x)
-        self.assertEqual(ed(x), ed(x))
-        self.assertEqual(hash(x), hash(x))
-        self.assertEqual(hash(ed(x)), hash(ed(x)))
-        self.assertEqual(x, x + x.zero())
-        self.assertEqual(ed(x), ed(x) + ed(x).zero())
-        self.assertEqual(ed(x + x), ed(x) + ed(x))
-        self.assertEqual(x, pickle.loads(pickle.dumps(x)))
-        self.assertEqual(ed(x), pickle.loads(pickle.dumps(ed(x))))
-        self.assertEqual(ed(x), ed(pickle.loads(pickle.dumps(x))))
+        self.assertAlmostEqualJSON(x.toJson(), EXPECTED_sumStructString[3])
+        autoassertions()
         x.fill(Struct(False, 2, 7.3, 'five'))
-        self.assertAlmostEqualJSON(x.toJson(), {'data': {'sum': 16.1, 'name': 'double + 1', 'entries': 5.0}, 'type': 'Sum'})
-        self.assertEqual(x, x)
-        self.assertEqual(ed(x), ed(x))
-        self.assertEqual(hash(x), hash(x))
-        self.assertEqual(hash(ed(x)), hash(ed(x)))
-        self.assertEqual(x, x + x.zero())
-        self.assertEqual(ed(x), ed(x) + ed(x).zero())
-        self.assertEqual(ed(x + x), ed(x) + ed(x))
-        self.assertEqual(x, pickle.loads(pickle.dumps(x)))
-        self.assertEqual(ed(x), pickle.loads(pickle.dumps(ed(x))))
-        self.assertEqual(ed(x), ed(pickle.loads(pickle.dumps(x))))
+        self.assertAlmostEqualJSON(x.toJson(), EXPECTED_sumStructString[4])
+        autoassertions()
         x.fill(Struct(False, 3, -4.7, 'six'))
-        self.assertAlmostEqualJSON(x.toJson(), {'data': {'sum': 12.399999999999999, 'name': 'double + 1', 'entries': 6.0}, 'type': 'Sum'})
-        self.assertEqual(x, x)
-        self.assertEqual(ed(x), ed(x))
-        self.assertEqual(hash(x), hash(x))
-        self.assertEqual(hash(ed(x)), hash(ed(x)))
-        self.assertEqual(x, x + x.zero())
-        self.assertEqual(ed(x), ed(x) + ed(x).zero())
-        self.assertEqual(ed(x + x), ed(x) + ed(x))
-        self.assertEqual(x, pickle.loads(pickle.dumps(x)))
-        self.assertEqual(ed(x), pickle.loads(pickle.dumps(ed(x))))
-        self.assertEqual(ed(x), ed(pickle.loads(pickle.dumps(x))))
+        self.assertAlmostEqualJSON(x.toJson(), EXPECTED_sumStructString[5])
+        autoassertions()
         x.fill(Struct(True, 4, 1.6, 'seven'))
-        self.assertAlmostEqualJSON(x.toJson(), {'data': {'sum': 15.0, 'name': 'double + 1', 'entries': 7.0}, 'type': 'Sum'})
-        self.assertEqual(x, x)
-        self.assertEqual(ed(x), ed(x))
-        self.assertEqual(hash(x), hash(x))
-        self.assertEqual(hash(ed(x)), hash(ed(x)))
-        self.assertEqual(x, x + x.zero())
-        self.assertEqual(ed(x), ed(x) + ed(x).zero())
-        self.assertEqual(ed(x + x), ed(x) + ed(x))
-        self.assertEqual(x, pickle.loads(pickle.dumps(x)))
-        self.assertEqual(ed(x), pickle.loads(pickle.dumps(ed(x))))
-        self.assertEqual(ed(x), ed(pickle.loads(pickle.dumps(x))))
+        self.assertAlmostEqualJSON(x.toJson(), EXPECTED_sumStructString[6])
+        autoassertions()
         x.fill(Struct(True, 5, 0.0, 'eight'))
-        self.assertAlmostEqualJSON(x.toJson(), {'data': {'sum': 16.0, 'name': 'double + 1', 'entries': 8.0}, 'type': 'Sum'})
-        self.assertEqual(x, x)
-        self.assertEqual(ed(x), ed(x))
-        self.assertEqual(hash(x), hash(x))
-        self.assertEqual(hash(ed(x)), hash(ed(x)))
-        self.assertEqual(x, x + x.zero())
-        self.assertEqual(ed(x), ed(x) + ed(x).zero())
-        self.assertEqual(ed(x + x), ed(x) + ed(x))
-        self.assertEqual(x, pickle.loads(pickle.dumps(x)))
-        self.assertEqual(ed(x), pickle.loads(pickle.dumps(ed(x))))
-        self.assertEqual(ed(x), ed(pickle.loads(pickle.dumps(x))))
+        self.assertAlmostEqualJSON(x.toJson(), EXPECTED_sumStructString[7])
+        autoassertions()
         x.fill(Struct(False, 6, -3.0, 'nine'))
-        self.assertAlmostEqualJSON(x.toJson(), {'data': {'sum': 14.0, 'name': 'double + 1', 'entries': 9.0}, 'type': 'Sum'})
-        self.assertEqual(x, x)
-        self.assertEqual(ed(x), ed(x))
-        self.assertEqual(hash(x), hash(x))
-        self.assertEqual(hash(ed(x)), hash(ed(x)))
-        self.assertEqual(x, x + x.zero())
-        self.assertEqual(ed(x), ed(x) + ed(x).zero())
-        self.assertEqual(ed(x + x), ed(x) + ed(x))
-        self.assertEqual(x, pickle.loads(pickle.dumps(x)))
-        self.assertEqual(ed(x), pickle.loads(pickle.dumps(ed(x))))
-        self.assertEqual(ed(x), ed(pickle.loads(pickle.dumps(x))))
+        self.assertAlmostEqualJSON(x.toJson(), EXPECTED_sumStructString[8])
+        autoassertions()
         x.fill(Struct(True, 7, -1.7, 'ten'))
-        self.assertAlmostEqualJSON(x.toJson(), {'data': {'sum': 13.3, 'name': 'double + 1', 'entries': 10.0}, 'type': 'Sum'})
+        self.assertAlmostEqualJSON(x.toJson(), EXPECTED_sumStructString[9])
 
     def test_average(self):
         x = Average(lambda x: x)
-        self.assertEqual(x, x)
-        self.assertEqual(ed(x), ed(x))
-        self.assertEqual(hash(x), hash(x))
-        self.assertEqual(hash(ed(x)), hash(ed(x)))
-        self.assertEqual(x, x + x.zero())
-        self.assertEqual(ed(x), ed(x) + ed(x).zero())
-        self.assertEqual(ed(x + x), ed(x) + ed(x))
-        self.assertEqual(x, pickle.loads(pickle.dumps(x)))
-        self.assertEqual(ed(x), pickle.loads(pickle.dumps(ed(x))))
-        self.assertEqual(ed(x), ed(pickle.loads(pickle.dumps(x))))
+        def autoassertions():
+            e = ed(x)
+            self.assertEqual(x, x)
+            self.assertEqual(e, ed(x))
+            self.assertEqual(hash(x), hash(x))
+            self.assertEqual(hash(e), hash(ed(x)))
+            self.assertEqual(x, x + x.zero())
+            self.assertEqual(e, e + e.zero())
+            self.assertEqual(ed(x + x), e + e)
+            self.assertEqual(x, pickle.loads(pickle.dumps(x, pickle.HIGHEST_PROTOCOL)))
+            self.assertEqual(e, pickle.loads(pickle.dumps(e, pickle.HIGHEST_PROTOCOL)))
+            self.assertEqual(e, ed(pickle.loads(pickle.dumps(x, pickle.HIGHEST_PROTOCOL))))
+        autoassertions()
         x.fill(3.4)
-        self.assertAlmostEqualJSON(x.toJson(), {'data': {'mean': 3.4, 'entries': 1}, 'type': 'Average'})
-        self.assertEqual(x, x)
-        self.assertEqual(ed(x), ed(x))
-        self.assertEqual(hash(x), hash(x))
-        self.assertEqual(hash(ed(x)), hash(ed(x)))
-        self.assertEqual(x, x + x.zero())
-        self.assertEqual(ed(x), ed(x) + ed(x).zero())
-        self.assertEqual(ed(x + x), ed(x) + ed(x))
-        self.assertEqual(x, pickle.loads(pickle.dumps(x)))
-        self.assertEqual(ed(x), pickle.loads(pickle.dumps(ed(x))))
-        self.assertEqual(ed(x), ed(pickle.loads(pickle.dumps(x))))
+        self.assertAlmostEqualJSON(x.toJson(), EXPECTED_average[0])
+        autoassertions()
         x.fill(2.2)
-        self.assertAlmostEqualJSON(x.toJson(), {'data': {'mean': 2.8, 'entries': 2}, 'type': 'Average'})
-        self.assertEqual(x, x)
-        self.assertEqual(ed(x), ed(x))
-        self.assertEqual(hash(x), hash(x))
-        self.assertEqual(hash(ed(x)), hash(ed(x)))
-        self.assertEqual(x, x + x.zero())
-        self.assertEqual(ed(x), ed(x) + ed(x).zero())
-        self.assertEqual(ed(x + x), ed(x) + ed(x))
-        self.assertEqual(x, pickle.loads(pickle.dumps(x)))
-        self.assertEqual(ed(x), pickle.loads(pickle.dumps(ed(x))))
-        self.assertEqual(ed(x), ed(pickle.loads(pickle.dumps(x))))
+        self.assertAlmostEqualJSON(x.toJson(), EXPECTED_average[1])
+        autoassertions()
         x.fill(-1.8)
-        self.assertAlmostEqualJSON(x.toJson(), {'data': {'mean': 1.2666666666666666, 'entries': 3}, 'type': 'Average'})
-        self.assertEqual(x, x)
-        self.assertEqual(ed(x), ed(x))
-        self.assertEqual(hash(x), hash(x))
-        self.assertEqual(hash(ed(x)), hash(ed(x)))
-        self.assertEqual(x, x + x.zero())
-        self.assertEqual(ed(x), ed(x) + ed(x).zero())
-        self.assertEqual(ed(x + x), ed(x) + ed(x))
-        self.assertEqual(x, pickle.loads(pickle.dumps(x)))
-        self.assertEqual(ed(x), pickle.loads(pickle.dumps(ed(x))))
-        self.assertEqual(ed(x), ed(pickle.loads(pickle.dumps(x))))
+        self.assertAlmostEqualJSON(x.toJson(), EXPECTED_average[2])
+        autoassertions()
         x.fill(0.0)
-        self.assertAlmostEqualJSON(x.toJson(), {'data': {'mean': 0.95, 'entries': 4}, 'type': 'Average'})
-        self.assertEqual(x, x)
-        self.assertEqual(ed(x), ed(x))
-        self.assertEqual(hash(x), hash(x))
-        self.assertEqual(hash(ed(x)), hash(ed(x)))
-        self.assertEqual(x, x + x.zero())
-        self.assertEqual(ed(x), ed(x) + ed(x).zero())
-        self.assertEqual(ed(x + x), ed(x) + ed(x))
-        self.assertEqual(x, pickle.loads(pickle.dumps(x)))
-        self.assertEqual(ed(x), pickle.loads(pickle.dumps(ed(x))))
-        self.assertEqual(ed(x), ed(pickle.loads(pickle.dumps(x))))
+        self.assertAlmostEqualJSON(x.toJson(), EXPECTED_average[3])
+        autoassertions()
         x.fill(7.3)
-        self.assertAlmostEqualJSON(x.toJson(), {'data': {'mean': 2.2199999999999998, 'entries': 5}, 'type': 'Average'})
-        self.assertEqual(x, x)
-        self.assertEqual(ed(x), ed(x))
-        self.assertEqual(hash(x), hash(x))
-        self.assertEqual(hash(ed(x)), hash(ed(x)))
-        self.assertEqual(x, x + x.zero())
-        self.assertEqual(ed(x), ed(x) + ed(x).zero())
-        self.assertEqual(ed(x + x), ed(x) + ed(x))
-        self.assertEqual(x, pickle.loads(pickle.dumps(x)))
-        self.assertEqual(ed(x), pickle.loads(pickle.dumps(ed(x))))
-        self.assertEqual(ed(x), ed(pickle.loads(pickle.dumps(x))))
+        self.assertAlmostEqualJSON(x.toJson(), EXPECTED_average[4])
+        autoassertions()
         x.fill(-4.7)
-        self.assertAlmostEqualJSON(x.toJson(), {'data': {'mean': 1.0666666666666667, 'entries': 6}, 'type': 'Average'})
-        self.assertEqual(x, x)
-        self.assertEqual(ed(x), ed(x))
-        self.assertEqual(hash(x), hash(x))
-        self.assertEqual(hash(ed(x)), hash(ed(x)))
-        self.assertEqual(x, x + x.zero())
-        self.assertEqual(ed(x), ed(x) + ed(x).zero())
-        self.assertEqual(ed(x + x), ed(x) + ed(x))
-        self.assertEqual(x, pickle.loads(pickle.dumps(x)))
-        self.assertEqual(ed(x), pickle.loads(pickle.dumps(ed(x))))
-        self.assertEqual(ed(x), ed(pickle.loads(pickle.dumps(x))))
+        self.assertAlmostEqualJSON(x.toJson(), EXPECTED_average[5])
+        autoassertions()
         x.fill(1.6)
-        self.assertAlmostEqualJSON(x.toJson(), {'data': {'mean': 1.1428571428571428, 'entries': 7}, 'type': 'Average'})
-        self.assertEqual(x, x)
-        self.assertEqual(ed(x), ed(x))
-        self.assertEqual(hash(x), hash(x))
-        self.assertEqual(hash(ed(x)), hash(ed(x)))
-        self.assertEqual(x, x + x.zero())
-        self.assertEqual(ed(x), ed(x) + ed(x).zero())
-        self.assertEqual(ed(x + x), ed(x) + ed(x))
-        self.assertEqual(x, pickle.loads(pickle.dumps(x)))
-        self.assertEqual(ed(x), pickle.loads(pickle.dumps(ed(x))))
-        self.assertEqual(ed(x), ed(pickle.loads(pickle.dumps(x))))
+        self.assertAlmostEqualJSON(x.toJson(), EXPECTED_average[6])
+        autoassertions()
         x.fill(0.0)
-        self.assertAlmostEqualJSON(x.toJson(), {'data': {'mean': 1.0, 'entries': 8}, 'type': 'Average'})
-        self.assertEqual(x, x)
-        self.assertEqual(ed(x), ed(x))
-        self.assertEqual(hash(x), hash(x))
-        self.assertEqual(hash(ed(x)), hash(ed(x)))
-        self.assertEqual(x, x + x.zero())
-        self.assertEqual(ed(x), ed(x) + ed(x).zero())
-        self.assertEqual(ed(x + x), ed(x) + ed(x))
-        self.assertEqual(x, pickle.loads(pickle.dumps(x)))
-        self.assertEqual(ed(x), pickle.loads(pickle.dumps(ed(x))))
-        self.assertEqual(ed(x), ed(pickle.loads(pickle.dumps(x))))
+        self.assertAlmostEqualJSON(x.toJson(), EXPECTED_average[7])
+        autoassertions()
         x.fill(-3.0)
-        self.assertAlmostEqualJSON(x.toJson(), {'data': {'mean': 0.5555555555555556, 'entries': 9}, 'type': 'Average'})
-        self.assertEqual(x, x)
-        self.assertEqual(ed(x), ed(x))
-        self.assertEqual(hash(x), hash(x))
-        self.assertEqual(hash(ed(x)), hash(ed(x)))
-        self.assertEqual(x, x + x.zero())
-        self.assertEqual(ed(x), ed(x) + ed(x).zero())
-        self.assertEqual(ed(x + x), ed(x) + ed(x))
-        self.assertEqual(x, pickle.loads(pickle.dumps(x)))
-        self.assertEqual(ed(x), pickle.loads(pickle.dumps(ed(x))))
-        self.assertEqual(ed(x), ed(pickle.loads(pickle.dumps(x))))
+        self.assertAlmostEqualJSON(x.toJson(), EXPECTED_average[8])
+        autoassertions()
         x.fill(-1.7)
-        self.assertAlmostEqualJSON(x.toJson(), {'data': {'mean': 0.32999999999999996, 'entries': 10}, 'type': 'Average'})
+        self.assertAlmostEqualJSON(x.toJson(), EXPECTED_average[9])
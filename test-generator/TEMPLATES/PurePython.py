@@ -14,48 +14,62 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import json
 import math
 import pickle
+import sys
 import unittest
 
 from histogrammar import *
 from histogrammar.histogram import Histogram
 
+if sys.version_info[0] > 2:
+    stringTypes = (str,)
+    numberTypes = (int, float)
+else:
+    stringTypes = (basestring,)
+    numberTypes = (int, long, float)
+
+{{EXPECTED}}
+
 class Struct(object):
     def __init__(self, x, y, z, w):
         self.bool = x
         self.int = y
         self.double = z
         self.string = w
+        self._repr = "Struct({}, {}, {}, {})".format(x, y, z, repr(w))
     def __repr__(self):
-        return "Struct({}, {}, {}, {})".format(self.bool, self.int, self.double, repr(self.string))
+        return self._repr
 
 def ed(x):
     return Factory.fromJson(x.toJson())
 
 class TestEverything(unittest.TestCase):
     def assertAlmostEqualJSON(self, x, y):
-        if isinstance(x, dict) and isinstance(y, dict):
-            if set(x.keys()) == set(y.keys()):
-                for k in x.keys():
-                    self.assertAlmostEqualJSON(x[k], y[k])
-            else:
-                raise AssertionError("keys {} are not equal to keys {}".format(sorted(x.keys()), sorted(y.keys())))
+        stack = [(x, y)]
+        while len(stack) > 0:
+            x, y = stack.pop()
 
-        elif isinstance(x, list) and isinstance(y, list):
-            if len(x) == len(y):
-                for xi, yi in zip(x, y):
-                    self.assertAlmostEqualJSON(xi, yi)
-            else:
-                raise AssertionError("length of {} is not equal to length of {}".format(x, y))
+            if isinstance(x, dict) and isinstance(y, dict):
+                if len(x) == len(y) and all(k in y for k in x):
+                    stack.extend((x[k], y[k]) for k in x)
+                else:
+                    raise AssertionError("keys {} are not equal to keys {}".format(sorted(x.keys()), sorted(y.keys())))
+
+            elif isinstance(x, list) and isinstance(y, list):
+                if len(x) == len(y):
+                    stack.extend(zip(x, y))
+                else:
+                    raise AssertionError("length of {} is not equal to length of {}".format(x, y))
 
-        elif isinstance(x, basestring) and isinstance(y, basestring):
-            self.assertEqual(x, y)
+            elif isinstance(x, stringTypes) and isinstance(y, stringTypes):
+                self.assertEqual(x, y)
 
-        elif isinstance(x, (int, long, float)) and isinstance(y, (int, long, float)):
-            self.assertAlmostEqual(x, y)
+            elif isinstance(x, numberTypes) and isinstance(y, numberTypes):
+                self.assertAlmostEqual(x, y)
 
-        else:
-            self.assertEqual(x, y)
+            else:
+                self.assertEqual(x, y)
 
 {{TESTS}}
@@ -1,5 +1,7 @@
 #!/usr/bin/env python
 
+import json
+
 simple = [3.4, 2.2, -1.8, 0.0, 7.3, -4.7, 1.6, 0.0, -3.0, -1.7]
 
 class Struct(object):
@@ -8,19 +10,24 @@ class Struct(object):
         self.int = y
         self.double = z
         self.string = w
+        self._repr = "Struct({}, {}, {}, {})".format(x, y, z, repr(w))
     def __repr__(self):
-        return "Struct({}, {}, {}, {})".format(self.bool, self.int, self.double, repr(self.string))
-
-struct = [Struct(True,  -2,  3.4, "one"),
-          Struct(False, -1,  2.2, "two"),
-          Struct(True,   0, -1.8, "three"),
-          Struct(False,  1,  0.0, "four"),
-          Struct(False,  2,  7.3, "five"),
-          Struct(False,  3, -4.7, "six"),
-          Struct(True,   4,  1.6, "seven"),
-          Struct(True,   5,  0.0, "eight"),
-          Struct(False,  6, -3.0, "nine"),
-          Struct(True,   7, -1.7, "ten")]
+        return self._repr
+
+structBool   = [True, False, True, False, False, False, True, True, False, True]
+structInt    = [-2, -1, 0, 1, 2, 3, 4, 5, 6, 7]
+structDouble = [3.4, 2.2, -1.8, 0.0, 7.3, -4.7, 1.6, 0.0, -3.0, -1.7]
+structString = ["one", "two", "three", "four", "five", "six", "seven", "eight", "nine", "ten"]
+
+struct = [Struct(x, y, z, w) for x, y, z, w in zip(structBool, structInt, structDouble, structString)]
+
+def cumulative(x):
+    out = []
+    total = 0.0
+    for xi in x:
+        total += xi
+        out.append(total)
+    return out
 
 def mean(x):
     if len(x) == 0:
@@ -29,22 +36,41 @@ def mean(x):
         return sum(x) / len(x)
 
 def meanWeighted(x, w):
-    if not any(_ > 0.0 for _ in w):
+    sw = swx = 0.0
+    for xi, wi in zip(x, w):
+        if wi > 0.0:
+            sw += wi
+            swx += xi * wi
+    if sw == 0.0:
         return 0.0
     else:
-        return sum(xi * max(wi, 0.0) for xi, wi in zip(x, w)) / sum(_ for _ in w if _ > 0.0)
+        return swx / sw
 
 def variance(x):
     if len(x) == 0:
         return 0.0
     else:
-        return sum(math.pow(_, 2) for _ in x) / len(x) - math.pow(sum(x) / len(x), 2)
+        n = 0
+        m = m2 = 0.0
+        for xi in x:
+            n += 1
+            delta = xi - m
+            m += delta / n
+            m2 += delta * (xi - m)
+        return m2 / n
 
 def varianceWeighted(x, w):
-    if not any(_ > 0.0 for _ in w):
+    sw = m = m2 = 0.0
+    for xi, wi in zip(x, w):
+        if wi > 0.0:
+            sw += wi
+            delta = xi - m
+            m += delta * wi / sw
+            m2 += wi * delta * (xi - m)
+    if sw == 0.0:
         return 0.0
     else:
-        return sum(xi**2 * max(wi, 0.0) for xi, wi in zip(x, w)) / sum(_ for _ in w if _ > 0.0) - math.pow(sum(xi * max(wi, 0.0) for xi, wi in zip(x, w)) / sum(_ for _ in w if _ > 0.0), 2)
+        return m2 / sw
 
 def mae(x):
     if len(x) == 0:
@@ -53,79 +79,122 @@ def mae(x):
         return sum(map(abs, x)) / len(x)
 
 def maeWeighted(x, w):
-    if not any(_ > 0.0 for _ in w):
+    npos = 0
+    swabs = 0.0
+    for xi, wi in zip(x, w):
+        if wi > 0.0:
+            npos += 1
+            swabs += abs(xi) * wi
+    if npos == 0:
         return 0.0
     else:
-        return sum(abs(xi) * max(wi, 0.0) for xi, wi in zip(x, w)) / sum(_ > 0.0 for _ in w)
+        return swabs / npos
 
 class PurePython(object):
+    __slots__ = ("name", "constructor", "autoassertions", "tests", "expected")
     var = "x"
+    check = "autoassertions"
+    defaultAutoAssertions = ()
 
-    def __init__(self, name, constructor, autoassertions=()):
+    def __init__(self, name, constructor, autoassertions=None):
         self.name = name
         self.constructor = constructor
-        self.autoassertions = autoassertions
+        if autoassertions is None:
+            self.autoassertions = self.defaultAutoAssertions
+        else:
+            self.autoassertions = tuple(autoassertions)
         self.tests = []
+        self.expected = []
 
     def test(self, fillvalue, assertion):
-        for x in self.autoassertions:
-            self.tests.append(x)
+        if len(self.autoassertions) > 0:
+            self.tests.append(self.check + "()")
         if fillvalue is not None:
-            self.tests.append("{}.fill({})".format(self.var, fillvalue))
+            self.tests.append(self.var + ".fill(" + str(fillvalue) + ")")
         self.tests.append(assertion)
 
-    def string(self):
-        out = []
-        out.append("    def test_{}(self):".format(self.name))
-        out.append("        {} = {}".format(self.var, self.constructor))
+    def expectedName(self):
+        return "EXPECTED_" + self.name
+
+    def toJsonAssertion(self, value):
+        self.expected.append(value)
+        return "self.assertAlmostEqualJSON(" + self.var + ".toJson(), " + self.expectedName() + "[" + str(len(self.expected) - 1) + "])"
+
+    def expectedLine(self):
+        return self.expectedName() + " = json.loads(" + repr(json.dumps(self.expected, sort_keys=True)) + ")"
+
+    def lines(self):
+        yield "    def test_" + self.name + "(self):"
+        yield "        " + self.var + " = " + self.constructor
+        if len(self.autoassertions) > 0:
+            yield "        def " + self.check + "():"
+            for autoassertion in self.autoassertions:
+                yield "            " + autoassertion
         for test in self.tests:
-            out.append("        " + test)
-        return "\n".join(out)
+            yield "        " + test
+
+    def writeInto(self, out):
+        for i, line in enumerate(self.lines()):
+            if i > 0:
+                out.write(b"\n")
+            out.write(line.encode("utf-8"))
 
 if __name__ == "__main__":
     ################################################ <init>
 
+    with open("TEMPLATES/PurePython.py", "rb") as template:
+        head, rest = template.read().split(b"{{EXPECTED}}", 1)
+        middle, tail = rest.split(b"{{TESTS}}", 1)
+
     purePython = []
     purePythonAutoAssertions = [
-        "self.assertEqual({}, {})".format(PurePython.var, PurePython.var),
-        "self.assertEqual(ed({}), ed({}))".format(PurePython.var, PurePython.var),
-        "self.assertEqual(hash({}), hash({}))".format(PurePython.var, PurePython.var),
-        "self.assertEqual(hash(ed({})), hash(ed({})))".format(PurePython.var, PurePython.var),
-        "self.assertEqual({}, {} + {}.zero())".format(PurePython.var, PurePython.var, PurePython.var),
-        "self.assertEqual(ed({}), ed({}) + ed({}).zero())".format(PurePython.var, PurePython.var, PurePython.var),
-        "self.assertEqual(ed({} + {}), ed({}) + ed({}))".format(PurePython.var, PurePython.var, PurePython.var, PurePython.var),
-        "self.assertEqual({}, pickle.loads(pickle.dumps({})))".format(PurePython.var, PurePython.var),
-        "self.assertEqual(ed({}), pickle.loads(pickle.dumps(ed({}))))".format(PurePython.var, PurePython.var),
-        "self.assertEqual(ed({}), ed(pickle.loads(pickle.dumps({}))))".format(PurePython.var, PurePython.var),
+        "e = ed({x})",
+        "self.assertEqual({x}, {x})",
+        "self.assertEqual(e, ed({x}))",
+        "self.assertEqual(hash({x}), hash({x}))",
+        "self.assertEqual(hash(e), hash(ed({x})))",
+        "self.assertEqual({x}, {x} + {x}.zero())",
+        "self.assertEqual(e, e + e.zero())",
+        "self.assertEqual(ed({x} + {x}), e + e)",
+        "self.assertEqual({x}, pickle.loads(pickle.dumps({x}, pickle.HIGHEST_PROTOCOL)))",
+        "self.assertEqual(e, pickle.loads(pickle.dumps(e, pickle.HIGHEST_PROTOCOL)))",
+        "self.assertEqual(e, ed(pickle.loads(pickle.dumps({x}, pickle.HIGHEST_PROTOCOL))))",
         ]
+    PurePython.defaultAutoAssertions = tuple(_.format(x=PurePython.var) for _ in purePythonAutoAssertions)
 
     ################################################ Count
 
-    count         = PurePython("count",         "Count()", purePythonAutoAssertions)
-    weightedCount = PurePython("weightedCount", "Count()", purePythonAutoAssertions)
+    count         = PurePython("count",         "Count()")
+    weightedCount = PurePython("weightedCount", "Count()")
+
+    cumulativePositive = cumulative(_ if _ >= 0.0 else 0.0 for _ in simple)
 
     for i in range(10):
-        count.test(simple[i], "self.assertAlmostEqualJSON({}.toJson(), {})".format(PurePython.var, {"type": "Count", "data": i + 1.0}))
-        weightedCount.test("3.14, {}".format(simple[i]), "self.assertAlmostEqualJSON({}.toJson(), {})".format(PurePython.var, {"type": "Count", "data": sum(filter(lambda _: _ >= 0.0, simple[:i+1]))}))
+        count.test(simple[i], count.toJsonAssertion({"type": "Count", "data": i + 1.0}))
+        weightedCount.test("3.14, " + str(simple[i]), weightedCount.toJsonAssertion({"type": "Count", "data": cumulativePositive[i]}))
 
     purePython.append(count)
     purePython.append(weightedCount)
 
     ################################################ Sum
 
-    summ            = PurePython("summ",            "Sum(lambda x: x + 1)",                     purePythonAutoAssertions)
-    sumWithName     = PurePython("sumWithName",     "Sum(named('something', lambda x: x + 1))", purePythonAutoAssertions)
-    sumString       = PurePython("sumString",     "Sum('x + 1')",                             purePythonAutoAssertions)
-    sumStruct       = PurePython("sumStruct",       "Sum(lambda x: x.double + 1)",              purePythonAutoAssertions)
-    sumStructString = PurePython("sumStructString", "Sum('double + 1')",                        purePythonAutoAssertions)
+    summ            = PurePython("summ",            "Sum(lambda x: x + 1)")
+    sumWithName     = PurePython("sumWithName",     "Sum(named('something', lambda x: x + 1))")
+    sumString       = PurePython("sumString",     "Sum('x + 1')")
+    sumStruct       = PurePython("sumStruct",       "Sum(lambda x: x.double + 1)")
+    sumStructString = PurePython("sumStructString", "Sum('double + 1')")
+
+    cumulativeSimple = cumulative(simple)
+    cumulativeStructDouble = cumulative(structDouble)
 
     for i in range(10):
-        result = sum(simple[:i+1]) + i + 1.0
-        summ.test(           simple[i], "self.assertAlmostEqualJSON({}.toJson(), {})".format(PurePython.var, {"type": "Sum", "data": {"entries": i + 1.0, "sum": result}}))
-        sumWithName.test(    simple[i], "self.assertAlmostEqualJSON({}.toJson(), {})".format(PurePython.var, {"type": "Sum", "data": {"entries": i + 1.0, "sum": result, "name": "something"}}))
-        sumString.test(      simple[i], "self.assertAlmostEqualJSON({}.toJson(), {})".format(PurePython.var, {"type": "Sum", "data": {"entries": i + 1.0, "sum": result, "name": "x + 1"}}))
-        sumStruct.test(      struct[i], "self.assertAlmostEqualJSON({}.toJson(), {})".format(PurePython.var, {"type": "Sum", "data": {"entries": i + 1.0, "sum": result}}))
-        sumStructString.test(struct[i], "self.assertAlmostEqualJSON({}.toJson(), {})".format(PurePython.var, {"type": "Sum", "data": {"entries": i + 1.0, "sum": result, "name": "double + 1"}}))
+        result = cumulativeSimple[i] + i + 1.0
+        structResult = cumulativeStructDouble[i] + i + 1.0
+        summ.test(           simple[i], summ.toJsonAssertion({"type": "Sum", "data": {"entries": i + 1.0, "sum": result}}))
+        sumWithName.test(    simple[i], sumWithName.toJsonAssertion({"type": "Sum", "data": {"entries": i + 1.0, "sum": result, "name": "something"}}))
+        sumString.test(      simple[i], sumString.toJsonAssertion({"type": "Sum", "data": {"entries": i + 1.0, "sum": result, "name": "x + 1"}}))
+        sumStruct.test(      struct[i], sumStruct.toJsonAssertion({"type": "Sum", "data": {"entries": i + 1.0, "sum": structResult}}))
+        sumStructString.test(struct[i], sumStructString.toJsonAssertion({"type": "Sum", "data": {"entries": i + 1.0, "sum": structResult, "name": "double + 1"}}))
 
     purePython.append(summ)
     purePython.append(sumWithName)
@@ -136,16 +205,23 @@ if __name__ == "__main__":
 
 ################################################ Average
 
-    average            = PurePython("average",            "Average(lambda x: x)",           purePythonAutoAssertions)
+    average            = PurePython("average",            "Average(lambda x: x)")
 
     for i in range(10):
-        result = mean(simple[:i+1])  
-	average.test( simple[i], "self.assertAlmostEqualJSON({}.toJson(), {})".format(PurePython.var, {"type": "Average", "data": {"entries": i+1, "mean": result}})) 
+        result = mean(simple[:i+1])
+        average.test(simple[i], average.toJsonAssertion({"type": "Average", "data": {"entries": i+1, "mean": result}}))
 
 
     purePython.append(average)
 
     ################################################ <finalize>
 
-    template = open("TEMPLATES/PurePython.py").read()
-    open("../python/test/autogenerated.py", "w").write(template.replace("{{TESTS}}", "\n\n".join(p.string() for p in purePython)))
+    with open("../python/test/autogenerated.py", "wb", buffering=1 << 20) as out:
+        out.write(head)
+        out.write("\n".join(p.expectedLine() for p in purePython if p.expected).encode("utf-8"))
+        out.write(middle)
+        for i, p in enumerate(purePython):
+            if i > 0:
+                out.write(b"\n\n")
+            p.writeInto(out)
+        out.write(tail)